@@ -1,42 +1,287 @@
 """News fetching utilities: RSS parsing and light scraping."""
 
 import asyncio
+import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import partial
+from typing import AsyncIterator, Callable, List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 import logging
 
 import aiohttp
-import feedparser
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from cssselect import GenericTranslator
+from lxml import etree
+from lxml import html as lhtml
 
 from ..models import Article, FeedConfig, Category
+from ._session import get_session, close_session
+from ._http_cache import HttpCache
+from ._feed_parse import parse_feed
 
 logger = logging.getLogger(__name__)
 
 # Only show articles from the last 2 weeks
 MAX_AGE_DAYS = 14
 
+# Article pages are truncated to this many bytes before parsing
+ARTICLE_MAX_BYTES = 256 * 1024
+
+
+# Feeds that advertise <lastBuildDate> do so near the top of the document
+_LASTBUILD_RE = re.compile(r'<lastBuildDate[^>]*>([^<]+)', re.I)
+_LASTBUILD_PEEK = 4096
+
+# Leading <?xml ...?> declaration of an XHTML page
+_XML_DECL_RE = re.compile(r'\s*<\?xml[^>]*\?>')
+
+# Compiled XPath expressions keyed by the CSS selector they came from
+_SEL_CACHE: Dict[str, etree.XPath] = {}
+
+
+def _compile_selector(selector: str) -> etree.XPath:
+    xpath = _SEL_CACHE.get(selector)
+    if xpath is None:
+        xpath = _SEL_CACHE[selector] = etree.XPath(GenericTranslator().css_to_xpath(selector))
+    return xpath
+
+
+def _parse_scrape(text: str, selector: str, url: str, limit: int) -> List[Tuple[str, str]]:
+    """Extract (title, href) pairs matching a CSS selector from a page."""
+    # lxml rejects str input that still carries an encoding declaration; the text is already decoded
+    m = _XML_DECL_RE.match(text)
+    if m:
+        text = text[m.end():]
+    try:
+        tree = lhtml.fromstring(text)
+    except (etree.ParserError, ValueError):
+        return []
+    links: List[Tuple[str, str]] = []
+    for el in _compile_selector(selector)(tree)[:limit]:
+        a = el if el.tag == 'a' else el.find('.//a')
+        if a is None or not a.get('href'):
+            continue
+        title = a.text_content().strip()
+        href = a.get('href')
+        # Normalize relative URLs
+        if href.startswith('/'):
+            href = url.rstrip('/') + href
+        links.append((title, href))
+    return links
+
+
+def _rss_articles(text: str, source_name: str, category: Category, limit: int) -> List[Article]:
+    """Parse a feed document into recent Articles."""
+    entries = parse_feed(text, limit=limit * 2)  # Fetch more to account for filtering
+
+    articles: List[Article] = []
+    cutoff_date = datetime.utcnow() - timedelta(days=MAX_AGE_DAYS)
+
+    for entry in entries:
+        article_id = entry['id'] or entry['link'] or entry['title']
+        published_at = entry['published']
+
+        # Skip articles older than 2 weeks
+        if published_at and published_at < cutoff_date:
+            logger.debug(f"Skipping old article from {source_name}: {entry['title'][:50]} (published {published_at})")
+            continue
+
+        articles.append(Article(
+            id=str(article_id),
+            headline=entry['title'][:300],
+            summary=entry['summary'][:1000],
+            source=source_name,
+            category=category,
+            url=entry['link'],
+            author=entry['author'],
+            published_at=published_at,
+        ))
+        if len(articles) >= limit:
+            break
+
+    if articles:
+        logger.debug(f"Fetched {len(articles)} articles from {source_name}")
+    return articles
+
+
+def _scrape_articles(text: str, selector: str, url: str, source_name: str, category: Category, limit: int) -> List[Article]:
+    """Turn scraped links into placeholder Articles."""
+    return [
+        Article(
+            id=href,
+            headline=title[:300],
+            summary='(scraped)',
+            source=source_name,
+            category=category,
+            url=href,
+        )
+        for title, href in _parse_scrape(text, selector, url, limit)
+    ]
+
+
+def _category_jobs(
+    feeds: List[Dict], scraping: List[Dict], category: Category, limit: int
+) -> List[Tuple[str, Callable[[str], List[Article]], Optional[tuple]]]:
+    """Pair each source URL with the parser for its response body.
+
+    RSS jobs also carry the key their lastBuildDate is remembered under.
+    """
+    jobs = []
+    for f in feeds:
+        parse = partial(_rss_articles, source_name=f.get('name', 'rss'), category=category, limit=limit)
+        jobs.append((f['url'], parse, (f['url'], category, limit)))
+    for s in scraping:
+        selector = s.get('selectors')
+        # If selectors is a dict, pick first selector value
+        sel = None
+        if isinstance(selector, dict):
+            sel = next(iter(selector.keys()), None)
+        elif isinstance(selector, str):
+            sel = selector
+        if sel:
+            jobs.append((s['url'], partial(
+                _scrape_articles, selector=sel, url=s['url'], source_name=s.get('name', 'scrape'), category=category, limit=limit
+            ), None))
+    return jobs
+
+
+# Class-based containers tried after <article>, in priority order
+_ARTICLE_SELECTORS = ('article', '.article-body', '.post-content', '.entry-content')
+_ARTICLE_CLASS_RE = re.compile(r'(?:^|\s)(?:article-body|post-content|entry-content)(?:\s|$)')
+
+
+class _ArticleStrainer(SoupStrainer):
+    """Parse-only filter keeping <article> and the known class-based containers."""
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name == 'article':
+            return True
+        cls = attrs.get('class') if attrs else None
+        if isinstance(cls, list):
+            cls = ' '.join(cls)
+        return bool(cls) and _ARTICLE_CLASS_RE.search(cls) is not None
+
+
+_ARTICLE_STRAINER = _ArticleStrainer()
+
+
+def _parse_article(text: str) -> str:
+    """Extract readable body text from an article page."""
+    # One strained parse builds every candidate container; try them in priority order
+    soup = BeautifulSoup(text, 'lxml', parse_only=_ARTICLE_STRAINER)
+    for sel in _ARTICLE_SELECTORS:
+        el = soup.select_one(sel)
+        if el:
+            content = el.get_text(separator='\n', strip=True)
+            if content:
+                return content
+    soup = BeautifulSoup(text, 'lxml')
+    return soup.get_text(separator='\n', strip=True)[:20000]
+
+
+async def _read_capped(resp: aiohttp.ClientResponse, max_bytes: int) -> str:
+    """Read at most max_bytes of a response body and decode it."""
+    buf = bytearray()
+    async for chunk in resp.content.iter_chunked(64 * 1024):
+        buf += chunk
+        if len(buf) >= max_bytes:
+            break
+    return bytes(buf[:max_bytes]).decode(resp.charset or 'utf-8', errors='replace')
+
 
 class NewsHandler:
     """Fetch articles from RSS feeds and scraping sources."""
 
-    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrency: int = 20,
+        max_per_host: int = 4,
+        http_cache_dir: Optional[str] = ".newsapp/http_cache",
+        http_cache_ttl: int = 90,
+    ):
         self._external_session = session
+        # Disk cache for conditional GETs; None disables it
+        self._http_cache = HttpCache(http_cache_dir, http_cache_ttl) if http_cache_dir else None
+        # Queue requests instead of stampeding every feed host at once
+        self._global_sem = asyncio.Semaphore(max_concurrency)
+        self._max_per_host = max_per_host
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        # Concurrent callers for the same request share one fetch
+        self._inflight: Dict[Tuple[str, Optional[int]], asyncio.Future] = {}
+        # Last seen lastBuildDate and parsed articles per (feed, category, limit)
+        self._last_build: Dict[tuple, Tuple[str, List[Article]]] = {}
+
+    def _unchanged_feed(self, key: tuple, text: str) -> Tuple[Optional[str], Optional[List[Article]]]:
+        """Return the feed's lastBuildDate and, if it hasn't moved, the articles parsed last time."""
+        m = _LASTBUILD_RE.search(text, 0, _LASTBUILD_PEEK)
+        if not m:
+            return None, None
+        stamp = m.group(1).strip()
+        prev = self._last_build.get(key)
+        if prev is not None and prev[0] == stamp:
+            # The feed hasn't moved, but the age cutoff has since the articles were parsed
+            cutoff_date = datetime.utcnow() - timedelta(days=MAX_AGE_DAYS)
+            return stamp, [a for a in prev[1] if not a.published_at or a.published_at >= cutoff_date]
+        return stamp, None
 
-    async def _fetch_text(self, url: str, timeout: int = 10) -> Optional[str]:
-        session = self._external_session or aiohttp.ClientSession()
+    async def _fetch_text(self, url: str, timeout: int = 10, max_bytes: Optional[int] = None) -> Optional[str]:
+        # One request task per URL; callers shield it so cancelling one doesn't abort the others
+        key = (url, max_bytes)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_text(url, timeout, max_bytes))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._request_done, key))
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: Tuple[str, Optional[int]], task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the outcome so a request every caller abandoned doesn't log a warning
+        if not task.cancelled():
+            task.exception()
+
+    async def _request_text(self, url: str, timeout: int, max_bytes: Optional[int] = None) -> Optional[str]:
+        # Truncated bodies must not end up in the response cache
+        cache = self._http_cache if max_bytes is None else None
+        cached = None
+        headers = {}
+        if cache:
+            cached = await asyncio.to_thread(cache.get, url)
+            if cached:
+                if cache.is_fresh(cached):
+                    return cached.body
+                if cached.etag:
+                    headers['If-None-Match'] = cached.etag
+                if cached.last_modified:
+                    headers['If-Modified-Since'] = cached.last_modified
+
+        session = self._external_session or await get_session()
+        host = urlparse(url).netloc
+        host_sem = self._host_sems.get(host)
+        if host_sem is None:
+            host_sem = self._host_sems[host] = asyncio.Semaphore(self._max_per_host)
         try:
-            async with session.get(url, timeout=timeout) as resp:
-                if resp.status != 200:
-                    logger.warning(f"Failed to fetch {url}: {resp.status}")
-                    return None
-                return await resp.text()
+            async with self._global_sem, host_sem:
+                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                    if resp.status == 304 and cached:
+                        await asyncio.to_thread(cache.touch, url, cached)
+                        return cached.body
+                    if resp.status != 200:
+                        logger.warning(f"Failed to fetch {url}: {resp.status}")
+                        return None
+                    if max_bytes is not None:
+                        return await _read_capped(resp, max_bytes)
+                    text = await resp.text()
+                    if cache:
+                        await asyncio.to_thread(
+                            cache.put, url, text, resp.headers.get('ETag'), resp.headers.get('Last-Modified')
+                        )
+                    return text
         except Exception as e:
             logger.exception(f"Error fetching {url}: {e}")
             return None
-        finally:
-            if not self._external_session:
-                await session.close()
 
     async def fetch_from_rss(self, feed_url: str, source_name: str, category: Category, limit: int = 20) -> List[Article]:
         """Fetch articles from an RSS feed URL."""
@@ -45,123 +290,128 @@ class NewsHandler:
             logger.debug(f"No text returned from {feed_url}")
             return []
 
-        try:
-            parsed = feedparser.parse(text)
-            if parsed.bozo:
-                logger.debug(f"Feed parse warning from {source_name}: {parsed.bozo_exception}")
-            
-            articles: List[Article] = []
-            now = datetime.utcnow()
-            cutoff_date = now - timedelta(days=MAX_AGE_DAYS)
-            
-            for entry in parsed.entries[:limit * 2]:  # Fetch more to account for filtering
-                article_id = entry.get('id') or entry.get('link') or entry.get('title')
-                published_parsed = entry.get('published_parsed')
-                published_at = None
-                if published_parsed:
-                    published_at = datetime(*published_parsed[:6])
-                
-                # Skip articles older than 2 weeks
-                if published_at and published_at < cutoff_date:
-                    logger.debug(f"Skipping old article from {source_name}: {entry.get('title', '')[:50]} (published {published_at})")
-                    continue
+        key = (feed_url, category, limit)
+        stamp, unchanged = self._unchanged_feed(key, text)
+        if unchanged is not None:
+            return unchanged
 
-                summary = entry.get('summary') or entry.get('description') or ''
-                article = Article(
-                    id=str(article_id),
-                    headline=entry.get('title', '')[:300],
-                    summary=summary[:1000],
-                    source=source_name,
-                    category=category,
-                    url=entry.get('link', ''),
-                    author=entry.get('author'),
-                    published_at=published_at,
-                )
-                articles.append(article)
-                if len(articles) >= limit:
-                    break
-            
-            if articles:
-                logger.debug(f"Fetched {len(articles)} articles from {source_name}")
-            return articles
+        try:
+            articles = await asyncio.to_thread(_rss_articles, text, source_name, category, limit)
         except Exception as e:
             logger.error(f"Error parsing feed from {source_name}: {e}")
             return []
+        if stamp:
+            self._last_build[key] = (stamp, articles)
+        return list(articles)
 
     async def fetch_from_scrape(self, url: str, selector: str, source_name: str, category: Category, limit: int = 20) -> List[Article]:
-        """A minimal scraping path using BeautifulSoup selectors."""
+        """A minimal scraping path using CSS selectors."""
         text = await self._fetch_text(url)
         if not text:
             return []
 
-        soup = BeautifulSoup(text, 'lxml')
-        results = soup.select(selector)
-        articles: List[Article] = []
-        for el in results[:limit]:
-            a = el.find('a') if el.name != 'a' else el
-            if not a or not a.get('href'):
-                continue
-            title = a.get_text(strip=True)
-            href = a.get('href')
-            # Normalize relative URLs
-            if href.startswith('/'):
-                href = url.rstrip('/') + href
-            article = Article(
-                id=href,
-                headline=title[:300],
-                summary='(scraped)',
-                source=source_name,
-                category=category,
-                url=href,
-            )
-            articles.append(article)
-        return articles
+        return await asyncio.to_thread(_scrape_articles, text, selector, url, source_name, category, limit)
+
+    async def stream_category(
+        self,
+        feeds: List[Dict],
+        scraping: List[Dict],
+        category: Category,
+        limit_per_source: int = 10,
+        parsers: int = 4,
+    ) -> AsyncIterator[Article]:
+        """Yield deduplicated articles for a category as each source is parsed.
+
+        Fetchers push raw documents into a bounded queue that a small pool of
+        parser workers drains, so the first articles arrive as soon as the
+        fastest source has been downloaded and parsed.
+        """
+        jobs = _category_jobs(feeds, scraping, category, limit_per_source)
+        if not jobs:
+            return
+
+        n_parsers = min(parsers, len(jobs))
+        q_parse: asyncio.Queue = asyncio.Queue(maxsize=16)
+        q_out: asyncio.Queue = asyncio.Queue()
+
+        async def fetch(url, parse, key):
+            text = await self._fetch_text(url)
+            if not text:
+                return
+            stamp = None
+            if key is not None:
+                # Feeds whose lastBuildDate hasn't moved skip the parser entirely
+                stamp, unchanged = self._unchanged_feed(key, text)
+                if unchanged is not None:
+                    await q_out.put(unchanged)
+                    return
+            await q_parse.put((url, parse, text, key, stamp))
+
+        async def fetch_all():
+            results = await asyncio.gather(*(fetch(*job) for job in jobs), return_exceptions=True)
+            for r in results:
+                if isinstance(r, Exception):
+                    logger.exception("Error in fetch task", exc_info=r)
+            for _ in range(n_parsers):
+                await q_parse.put(None)
+
+        async def parse_worker():
+            try:
+                while True:
+                    item = await q_parse.get()
+                    if item is None:
+                        break
+                    url, parse, text, key, stamp = item
+                    try:
+                        articles = await asyncio.to_thread(parse, text)
+                    except Exception as e:
+                        logger.error(f"Error parsing {url}: {e}")
+                        continue
+                    if stamp:
+                        self._last_build[key] = (stamp, articles)
+                    await q_out.put(list(articles))
+            finally:
+                await q_out.put(None)
+
+        tasks = [asyncio.create_task(fetch_all())]
+        tasks.extend(asyncio.create_task(parse_worker()) for _ in range(n_parsers))
+        # str caches its own hash, so keying on the id costs one hash per unique URL
+        seen: set = set()
+        seen_add = seen.add
+        running = n_parsers
+        try:
+            while running:
+                batch = await q_out.get()
+                if batch is None:
+                    running -= 1
+                    continue
+                for a in batch:
+                    key = a.id
+                    if key not in seen:
+                        seen_add(key)
+                        yield a
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def fetch_category(self, feeds: List[Dict], scraping: List[Dict], category: Category, limit_per_source: int = 10) -> List[Article]:
         """Fetch from multiple feed sources and scraping sources concurrently."""
-        tasks = []
-        for f in feeds:
-            tasks.append(self.fetch_from_rss(f['url'], f.get('name', 'rss'), category, limit_per_source))
-        for s in scraping:
-            selector = s.get('selectors')
-            # If selectors is a dict, pick first selector value
-            sel = None
-            if isinstance(selector, dict):
-                sel = next(iter(selector.keys()), None)
-            elif isinstance(selector, str):
-                sel = selector
-            if sel:
-                tasks.append(self.fetch_from_scrape(s['url'], sel, s.get('name', 'scrape'), category, limit_per_source))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        articles: List[Article] = []
-        seen = set()
-        for r in results:
-            if isinstance(r, Exception):
-                logger.exception("Error in fetch task", exc_info=r)
-                continue
-            for a in r:
-                if a.id in seen:
-                    continue
-                seen.add(a.id)
-                articles.append(a)
-        return articles
+        return [a async for a in self.stream_category(feeds, scraping, category, limit_per_source)]
+
+    async def close(self) -> None:
+        """Release the shared HTTP session (a caller-supplied session is left open)."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._external_session is None:
+            await close_session()
 
     async def fetch_article_content(self, article: Article) -> Optional[str]:
         """Fetch and populate full content for an article."""
-        text = await self._fetch_text(article.url)
+        text = await self._fetch_text(article.url, max_bytes=ARTICLE_MAX_BYTES)
         if not text:
             return None
-        soup = BeautifulSoup(text, 'lxml')
-        # Try common article selectors
-        selectors = ['article', '.article-body', '.post-content', '.entry-content']
-        content = None
-        for sel in selectors:
-            el = soup.select_one(sel)
-            if el:
-                content = el.get_text(separator='\n', strip=True)
-                break
-        if not content:
-            content = soup.get_text(separator='\n', strip=True)[:20000]
+        content = await asyncio.to_thread(_parse_article, text)
         article.content = content
+        article.display_text = content or article.summary or None
         return content
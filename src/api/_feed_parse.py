@@ -0,0 +1,101 @@
+"""Streaming RSS/Atom parsing with lxml.
+
+Only the handful of fields NewsApp uses are extracted, so this is much
+lighter than a general-purpose feed parser.
+"""
+
+import io
+import logging
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Union
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+_ITEM_TAGS = ("{*}item", "{*}entry")
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+def _text(el, path: str) -> str:
+    value = el.findtext(path)
+    return value.strip() if value else ""
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """Parse an RFC 822 or ISO 8601 date into a naive UTC datetime."""
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _link(el) -> str:
+    # RSS puts the URL in the element text, Atom in an href attribute
+    for link in el.iterfind("{*}link"):
+        if link.text and link.text.strip():
+            return link.text.strip()
+        href = link.get("href")
+        if href and link.get("rel", "alternate") == "alternate":
+            return href
+    return ""
+
+
+def _entry(el) -> Dict:
+    return {
+        "id": _text(el, "{*}guid") or _text(el, "{*}id"),
+        "title": _text(el, "{*}title"),
+        "link": _link(el),
+        "summary": _text(el, "{*}description") or _text(el, "{*}summary") or _text(el, "{*}content"),
+        "published": _parse_date(
+            _text(el, "{*}pubDate") or _text(el, "{*}published") or _text(el, "{*}updated") or _text(el, "{*}date")
+        ),
+        "author": _text(el, "{*}author/{*}name") or _text(el, "{*}author") or _text(el, "{*}creator") or None,
+    }
+
+
+def parse_feed(xml: Union[bytes, str], limit: Optional[int] = None) -> List[Dict]:
+    """Extract entries from an RSS or Atom document.
+
+    Args:
+        xml: Raw feed bytes, or already-decoded text.
+        limit: Stop after this many entries.
+
+    Returns:
+        List of dicts with id, title, link, summary, published and author.
+    """
+    if isinstance(xml, str):
+        # Text is already decoded, so drop any declared encoding and re-encode as UTF-8
+        xml = _XML_DECL_RE.sub("", xml.lstrip("\ufeff"), count=1).encode("utf-8")
+
+    entries: List[Dict] = []
+    context = etree.iterparse(
+        io.BytesIO(xml),
+        events=("end",),
+        tag=_ITEM_TAGS,
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+    try:
+        for _, el in context:
+            entries.append(_entry(el))
+            # Keep memory flat by discarding processed items
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+            if limit is not None and len(entries) >= limit:
+                break
+    except etree.XMLSyntaxError as e:
+        logger.debug(f"Feed parse warning: {e}")
+    return entries
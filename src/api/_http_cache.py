@@ -0,0 +1,64 @@
+"""Small on-disk HTTP response cache used for conditional feed fetches."""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    """A cached response body with its validators."""
+
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class HttpCache:
+    """Filesystem cache of response bodies keyed by URL."""
+
+    def __init__(self, root: str = ".newsapp/http_cache", ttl: int = 90):
+        self.root = Path(root)
+        self.ttl = ttl
+
+    def _path(self, url: str) -> Path:
+        return self.root / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for a URL, or None if absent or unreadable."""
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return CacheEntry(data["body"], data.get("etag"), data.get("last_modified"), data["fetched_at"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable HTTP cache entry for {url}: {e}")
+            return None
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    def put(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CacheEntry:
+        """Store a response body and its validators."""
+        entry = CacheEntry(body, etag, last_modified, time.time())
+        path = self._path(url)
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry._asdict(), f)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.debug(f"Failed to write HTTP cache entry for {url}: {e}")
+        return entry
+
+    def touch(self, url: str, entry: CacheEntry) -> CacheEntry:
+        """Mark an entry as revalidated (e.g. after a 304)."""
+        return self.put(url, entry.body, entry.etag, entry.last_modified)
@@ -0,0 +1,41 @@
+"""Shared aiohttp session for all outbound news requests."""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+USER_AGENT = "NewsApp/0.1 (+https://github.com/yourusername/newsapp)"
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession, creating it on first use.
+
+    The session is bound to the event loop it was created on, so a new one is
+    built if the previous session was closed or belongs to another loop.
+    """
+    global _session
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session._loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10, connect=5),
+            headers={"User-Agent": USER_AGENT},
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session if one is open."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
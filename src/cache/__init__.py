@@ -1,25 +1,105 @@
 """SQLite-based cache manager for NewsApp."""
 
 import sqlite3
+import threading
 from typing import List, Optional
 from datetime import datetime, timedelta
 import logging
 import json
 from pathlib import Path
 
+import msgspec
+
 from ..models import Article, Category
 
 logger = logging.getLogger(__name__)
 
+# Tags are stored as MessagePack blobs
+_encode_tags = msgspec.msgpack.Encoder().encode
+_decode_tags = msgspec.msgpack.Decoder(List[str]).decode
+
+# Row values map straight to members without going through Enum lookup
+_CAT_BY_VALUE = {c.value: c for c in Category}
+_US = Category.US
+
+# Statements are kept as constants so every call hits sqlite3's statement cache
+_SQL_INSERT = (
+    "INSERT OR REPLACE INTO articles (id, headline, summary, source, category, url, author, "
+    "published_at, image_url, content, read_time, tags_mp, is_read, is_bookmarked, cached_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_GET_ARTICLES = {
+    # Keyed by (filter on category, filter on cached_at)
+    (False, False): "SELECT * FROM articles ORDER BY published_at DESC LIMIT ?",
+    (True, False): "SELECT * FROM articles WHERE category = ? ORDER BY published_at DESC LIMIT ?",
+    (False, True): "SELECT * FROM articles WHERE cached_at >= ? ORDER BY published_at DESC LIMIT ?",
+    (True, True): (
+        "SELECT * FROM articles WHERE category = ? AND cached_at >= ? ORDER BY published_at DESC LIMIT ?"
+    ),
+}
+_SQL_GET_BOOKMARKED = "SELECT * FROM articles WHERE is_bookmarked = 1 ORDER BY published_at DESC LIMIT ?"
+_SQL_MARK_READ = "UPDATE articles SET is_read = ? WHERE id = ?"
+_SQL_MARK_BOOKMARKED = "UPDATE articles SET is_bookmarked = ? WHERE id = ?"
+_SQL_DELETE_OLD = "DELETE FROM articles WHERE cached_at < ?"
+
+
+def _legacy_tags(text: str) -> List[str]:
+    """Decode a legacy JSON tags value, treating malformed rows as untagged."""
+    try:
+        tags = json.loads(text)
+    except ValueError:
+        return []
+    return tags if isinstance(tags, list) else []
+
+
+def _row_to_article(r: sqlite3.Row, _fromiso=datetime.fromisoformat, _decode=_decode_tags) -> Article:
+    """Build an Article from an ``articles`` row."""
+    published_at = None
+    if r['published_at']:
+        try:
+            published_at = _fromiso(r['published_at'])
+        except Exception:
+            published_at = None
+    return Article(
+        id=r['id'],
+        headline=r['headline'],
+        summary=r['summary'],
+        source=r['source'],
+        category=_CAT_BY_VALUE.get(r['category'], _US),
+        url=r['url'],
+        author=r['author'],
+        published_at=published_at,
+        image_url=r['image_url'],
+        content=r['content'],
+        read_time_minutes=r['read_time'],
+        tags=_decode(r['tags_mp']) if r['tags_mp'] else [],
+        is_read=bool(r['is_read']),
+        is_bookmarked=bool(r['is_bookmarked']),
+        cached_at=_fromiso(r['cached_at']) if r['cached_at'] else None,
+    )
+
 
 class CacheManager:
-    """Simple SQLite-backed cache for articles."""
+    """Simple SQLite-backed cache for articles.
+
+    Methods are synchronous; async callers should run them with
+    ``asyncio.to_thread`` so disk writes never block the event loop. Access
+    to the shared connection is serialized with a lock.
+    """
 
     def __init__(self, db_path: str = ".newsapp/cache.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, cached_statements=256)
         self._conn.row_factory = sqlite3.Row
+        # WAL lets the UI read while a refresh writes; NORMAL sync is enough for a cache
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        # Bound the page cache to ~8 MiB and map up to 64 MiB of the file
+        self._conn.execute("PRAGMA cache_size=-8000")
+        self._conn.execute("PRAGMA mmap_size=67108864")
         self._ensure_schema()
 
     def _ensure_schema(self):
@@ -38,142 +118,108 @@ class CacheManager:
                 image_url TEXT,
                 content TEXT,
                 read_time INTEGER,
-                tags TEXT,
+                tags_mp BLOB,
                 is_read INTEGER DEFAULT 0,
                 is_bookmarked INTEGER DEFAULT 0,
                 cached_at TEXT
             )
             """
         )
+        columns = {row[1] for row in cur.execute("PRAGMA table_info(articles)")}
+        # On SQLite < 3.35 the emptied legacy column stays behind; only migrate while it holds data
+        if "tags" in columns and (
+            "tags_mp" not in columns
+            or cur.execute("SELECT 1 FROM articles WHERE tags IS NOT NULL LIMIT 1").fetchone()
+        ):
+            self._migrate_json_tags(cur, columns)
+        cur.execute("CREATE INDEX IF NOT EXISTS ix_cat_pub ON articles(category, published_at DESC)")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS ix_bm_pub ON articles(is_bookmarked, published_at DESC) "
+            "WHERE is_bookmarked = 1"
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS ix_cached_at ON articles(cached_at)")
         self._conn.commit()
 
+    def _migrate_json_tags(self, cur: sqlite3.Cursor, columns: set):
+        """Move tags from the legacy JSON text column into tags_mp."""
+        logger.info("Migrating cached article tags to MessagePack")
+        if "tags_mp" not in columns:
+            cur.execute("ALTER TABLE articles ADD COLUMN tags_mp BLOB")
+        rows = cur.execute("SELECT id, tags FROM articles WHERE tags IS NOT NULL").fetchall()
+        cur.executemany(
+            "UPDATE articles SET tags_mp = ? WHERE id = ?",
+            [(_encode_tags(_legacy_tags(r['tags'])), r['id']) for r in rows],
+        )
+        # DROP COLUMN needs SQLite 3.35; older libraries keep the column, emptied so later runs skip it
+        if sqlite3.sqlite_version_info >= (3, 35):
+            cur.execute("ALTER TABLE articles DROP COLUMN tags")
+        else:
+            cur.execute("UPDATE articles SET tags = NULL")
+
     def save_articles(self, articles: List[Article]):
-        cur = self._conn.cursor()
-        for a in articles:
-            cur.execute(
-                """
-                INSERT OR REPLACE INTO articles (id, headline, summary, source, category, url, author,
-                published_at, image_url, content, read_time, tags, is_read, is_bookmarked, cached_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    a.id,
-                    a.headline,
-                    a.summary,
-                    a.source,
-                    a.category.value if isinstance(a.category, Category) else str(a.category),
-                    a.url,
-                    a.author,
-                    a.published_at.isoformat() if a.published_at else None,
-                    a.image_url,
-                    a.content,
-                    a.read_time_minutes,
-                    json.dumps(a.tags),
-                    1 if a.is_read else 0,
-                    1 if a.is_bookmarked else 0,
-                    (a.cached_at or datetime.utcnow()).isoformat(),
-                ),
+        now = datetime.utcnow()
+        rows = [
+            (
+                a.id,
+                a.headline,
+                a.summary,
+                a.source,
+                a.category.value if isinstance(a.category, Category) else str(a.category),
+                a.url,
+                a.author,
+                a.published_at.isoformat() if a.published_at else None,
+                a.image_url,
+                a.content,
+                a.read_time_minutes,
+                _encode_tags(a.tags),
+                1 if a.is_read else 0,
+                1 if a.is_bookmarked else 0,
+                (a.cached_at or now).isoformat(),
             )
-        self._conn.commit()
+            for a in articles
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(_SQL_INSERT, rows)
 
     def get_articles(self, category: Optional[Category] = None, max_age_hours: Optional[int] = None, limit: int = 50) -> List[Article]:
-        cur = self._conn.cursor()
-        q = "SELECT * FROM articles"
         params = []
-        clauses = []
         if category:
-            clauses.append("category = ?")
             params.append(category.value if isinstance(category, Category) else str(category))
         if max_age_hours is not None:
-            cutoff = (datetime.utcnow() - timedelta(hours=max_age_hours)).isoformat()
-            clauses.append("cached_at >= ?")
-            params.append(cutoff)
-        if clauses:
-            q += " WHERE " + " AND ".join(clauses)
-        q += " ORDER BY published_at DESC LIMIT ?"
+            params.append((datetime.utcnow() - timedelta(hours=max_age_hours)).isoformat())
         params.append(limit)
-        cur.execute(q, params)
-        rows = cur.fetchall()
+        q = _SQL_GET_ARTICLES[bool(category), max_age_hours is not None]
         articles: List[Article] = []
-        for r in rows:
-            published_at = None
-            if r['published_at']:
-                try:
-                    published_at = datetime.fromisoformat(r['published_at'])
-                except Exception:
-                    published_at = None
-            tags = json.loads(r['tags']) if r['tags'] else []
-            article = Article(
-                id=r['id'],
-                headline=r['headline'],
-                summary=r['summary'],
-                source=r['source'],
-                category=Category(r['category']) if r['category'] else Category.US,
-                url=r['url'],
-                author=r['author'],
-                published_at=published_at,
-                image_url=r['image_url'],
-                content=r['content'],
-                read_time_minutes=r['read_time'],
-                tags=tags,
-                is_read=bool(r['is_read']),
-                is_bookmarked=bool(r['is_bookmarked']),
-                cached_at=datetime.fromisoformat(r['cached_at']) if r['cached_at'] else None,
-            )
-            articles.append(article)
+        with self._lock:
+            cur = self._conn.execute(q, params)
+            while rows := cur.fetchmany(256):
+                articles.extend(_row_to_article(r) for r in rows)
         return articles
 
     def mark_as_read(self, article_id: str, read: bool = True):
-        cur = self._conn.cursor()
-        cur.execute("UPDATE articles SET is_read = ? WHERE id = ?", (1 if read else 0, article_id))
-        self._conn.commit()
+        with self._lock, self._conn:
+            self._conn.execute(_SQL_MARK_READ, (1 if read else 0, article_id))
 
     def mark_as_bookmarked(self, article_id: str, bookmarked: bool = True):
-        cur = self._conn.cursor()
-        cur.execute("UPDATE articles SET is_bookmarked = ? WHERE id = ?", (1 if bookmarked else 0, article_id))
-        self._conn.commit()
+        with self._lock, self._conn:
+            self._conn.execute(_SQL_MARK_BOOKMARKED, (1 if bookmarked else 0, article_id))
 
     def get_bookmarked_articles(self, limit: int = 50) -> List[Article]:
-        cur = self._conn.cursor()
-        cur.execute("SELECT * FROM articles WHERE is_bookmarked = 1 ORDER BY published_at DESC LIMIT ?", (limit,))
-        rows = cur.fetchall()
         articles: List[Article] = []
-        for r in rows:
-            published_at = None
-            if r['published_at']:
-                try:
-                    published_at = datetime.fromisoformat(r['published_at'])
-                except Exception:
-                    published_at = None
-            tags = json.loads(r['tags']) if r['tags'] else []
-            article = Article(
-                id=r['id'],
-                headline=r['headline'],
-                summary=r['summary'],
-                source=r['source'],
-                category=Category(r['category']) if r['category'] else Category.US,
-                url=r['url'],
-                author=r['author'],
-                published_at=published_at,
-                image_url=r['image_url'],
-                content=r['content'],
-                read_time_minutes=r['read_time'],
-                tags=tags,
-                is_read=bool(r['is_read']),
-                is_bookmarked=bool(r['is_bookmarked']),
-                cached_at=datetime.fromisoformat(r['cached_at']) if r['cached_at'] else None,
-            )
-            articles.append(article)
+        with self._lock:
+            cur = self._conn.execute(_SQL_GET_BOOKMARKED, (limit,))
+            while rows := cur.fetchmany(256):
+                articles.extend(_row_to_article(r) for r in rows)
         return articles
 
     def clear_old_articles(self, older_than_days: int = 30):
         cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
-        cur = self._conn.cursor()
-        cur.execute("DELETE FROM articles WHERE cached_at < ?", (cutoff,))
-        self._conn.commit()
+        with self._lock, self._conn:
+            self._conn.execute(_SQL_DELETE_OLD, (cutoff,))
 
     def close(self):
         try:
-            self._conn.close()
+            with self._lock:
+                self._conn.close()
         except Exception:
             pass
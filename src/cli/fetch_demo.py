@@ -0,0 +1,67 @@
+"""Demo script to fetch and display RSS feed content.
+
+Run with ``python -m src.cli.fetch_demo`` or the ``newsapp-demo`` script.
+"""
+
+import asyncio
+
+from ..config import ConfigManager
+from ..api import NewsHandler
+from ..models import Category
+
+
+CATEGORIES = [
+    (Category.BREAKING, "Breaking News"),
+    (Category.AGENTIC_AI_DEV, "Agentic AI Developer"),
+    (Category.AGENTIC_AI_BUS, "Agentic AI Business"),
+]
+
+
+async def _run():
+    """Fetch and display feeds for the new categories."""
+    config = ConfigManager()
+    handler = NewsHandler(http_cache_dir=None)
+    
+    try:
+        for category, cat_name in CATEGORIES:
+            print(f"\n{'='*80}")
+            print(f"📰 {cat_name.upper()}")
+            print(f"{'='*80}")
+            
+            feeds = config.get_feeds_for_category(category.value)
+            scraping = config.get_scraping_sources_for_category(category.value)
+            print(f"\nConfigured feeds: {len(feeds)}")
+            for feed in feeds:
+                print(f"  • {feed['name']}: {feed['url']}")
+            
+            print(f"\nFetching articles...")
+            articles = await handler.fetch_category(feeds, scraping, category, limit_per_source=5)
+            
+            if not articles:
+                print("  ❌ No articles fetched")
+                continue
+            
+            print(f"  ✅ Fetched {len(articles)} articles\n")
+            
+            for i, article in enumerate(articles[:5], 1):
+                print(f"{i}. {article.headline[:75]}")
+                print(f"   Source: {article.source}")
+                print(f"   URL: {article.url}")
+                if article.summary:
+                    summary_text = article.summary[:150].replace('\n', ' ')
+                    print(f"   Summary: {summary_text}...")
+                if article.content:
+                    content_preview = article.content[:200].replace('\n', ' ')
+                    print(f"   Content: {content_preview}...")
+                print()
+    finally:
+        await handler.close()
+
+
+def main():
+    """Entry point for the ``newsapp-demo`` script."""
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,24 @@
 """Configuration management for NewsApp."""
 
+import copy
 import os
 import yaml
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader and emitter are much faster than the pure-Python ones when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed config files keyed by (path, mtime_ns)
+_YAML_CACHE: Dict[Tuple[str, int], dict] = {}
+
 
 @dataclass
 class UIConfig:
@@ -45,6 +54,119 @@ class LogConfig:
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 
+# Built once at import; NewsConfig hands out copies because feeds are edited in place
+_DEFAULT_RSS_FEEDS: Mapping[str, Dict] = MappingProxyType({
+    # Breaking News
+    "bbc_breaking": {
+        "url": "https://feeds.bbci.co.uk/news/rss.xml",
+        "categories": ["breaking"],
+    },
+    "cnn_breaking": {
+        "url": "http://rss.cnn.com/rss/cnn_topstories.rss",
+        "categories": ["breaking"],
+    },
+    "npr_breaking": {
+        "url": "https://feeds.npr.org/1001/rss.xml",
+        "categories": ["breaking", "us", "world"],
+    },
+    # AI Developer News (current sources)
+    "hackernews": {
+        "url": "https://news.ycombinator.com/rss",
+        "categories": ["tech", "business", "agentic_ai_dev"],
+    },
+    "arxiv_ai": {
+        "url": "http://export.arxiv.org/rss/cs.AI",
+        "categories": ["agentic_ai_dev", "science"],
+    },
+    "arxiv_ml": {
+        "url": "http://export.arxiv.org/rss/cs.LG",
+        "categories": ["agentic_ai_dev", "science"],
+    },
+    # AI Business News (current sources)
+    "techcrunch_ai": {
+        "url": "https://techcrunch.com/category/artificial-intelligence/feed/",
+        "categories": ["agentic_ai_business", "tech", "business"],
+    },
+    "venturebeat_ai": {
+        "url": "https://venturebeat.com/category/ai/feed/",
+        "categories": ["agentic_ai_business", "tech"],
+    },
+    "mit_tech_ai": {
+        "url": "https://www.technologyreview.com/topic/artificial-intelligence/feed",
+        "categories": ["agentic_ai_business", "tech"],
+    },
+    # General Tech & Business
+    "techcrunch": {
+        "url": "https://techcrunch.com/feed/",
+        "categories": ["tech", "business"],
+    },
+    "bbc_tech": {
+        "url": "https://feeds.bbci.co.uk/news/technology/rss.xml",
+        "categories": ["tech"],
+    },
+    "bbc_us": {
+        "url": "https://feeds.bbci.co.uk/news/world/us_and_canada/rss.xml",
+        "categories": ["us", "world"],
+    },
+    "bbc_world": {
+        "url": "https://feeds.bbci.co.uk/news/world/rss.xml",
+        "categories": ["world"],
+    },
+    "bbc_business": {
+        "url": "https://feeds.bbci.co.uk/news/business/rss.xml",
+        "categories": ["business"],
+    },
+    "bbc_science": {
+        "url": "https://feeds.bbci.co.uk/news/science_and_environment/rss.xml",
+        "categories": ["science"],
+    },
+    "bbc_sport": {
+        "url": "https://feeds.bbci.co.uk/sport/rss.xml",
+        "categories": ["sports"],
+    },
+    "bbc_entertainment": {
+        "url": "https://feeds.bbci.co.uk/news/entertainment_and_arts/rss.xml",
+        "categories": ["entertainment"],
+    },
+    "cnn_us": {
+        "url": "http://rss.cnn.com/rss/cnn_us.rss",
+        "categories": ["us"],
+    },
+    "cnn_world": {
+        "url": "http://rss.cnn.com/rss/cnn_world.rss",
+        "categories": ["world"],
+    },
+    "cnn_tech": {
+        "url": "http://rss.cnn.com/rss/cnn_tech.rss",
+        "categories": ["tech"],
+    },
+    "reuters_business": {
+        "url": "https://www.reuters.com/finance",
+        "categories": ["business"],
+    },
+    "guardian_world": {
+        "url": "https://www.theguardian.com/world/rss",
+        "categories": ["world"],
+    },
+    "guardian_us": {
+        "url": "https://www.theguardian.com/us-news/rss",
+        "categories": ["us"],
+    },
+    "guardian_tech": {
+        "url": "https://www.theguardian.com/technology/rss",
+        "categories": ["tech"],
+    },
+    "bbc_health": {
+        "url": "https://feeds.bbci.co.uk/news/health/rss.xml",
+        "categories": ["science"],
+    },
+    "wired_tech": {
+        "url": "https://www.wired.com/feed/rss",
+        "categories": ["tech"],
+    },
+})
+
+
 @dataclass
 class NewsConfig:
     """News source configuration."""
@@ -62,116 +184,10 @@ class NewsConfig:
     
     @staticmethod
     def _default_rss_feeds() -> Dict[str, Dict[str, str]]:
-        """Return default RSS feed configuration."""
+        """Return a fresh, mutable copy of the default RSS feed configuration."""
         return {
-            # Breaking News
-            "bbc_breaking": {
-                "url": "https://feeds.bbci.co.uk/news/rss.xml",
-                "categories": ["breaking"],
-            },
-            "cnn_breaking": {
-                "url": "http://rss.cnn.com/rss/cnn_topstories.rss",
-                "categories": ["breaking"],
-            },
-            "npr_breaking": {
-                "url": "https://feeds.npr.org/1001/rss.xml",
-                "categories": ["breaking", "us", "world"],
-            },
-            # AI Developer News (current sources)
-            "hackernews": {
-                "url": "https://news.ycombinator.com/rss",
-                "categories": ["tech", "business", "agentic_ai_dev"],
-            },
-            "arxiv_ai": {
-                "url": "http://export.arxiv.org/rss/cs.AI",
-                "categories": ["agentic_ai_dev", "science"],
-            },
-            "arxiv_ml": {
-                "url": "http://export.arxiv.org/rss/cs.LG",
-                "categories": ["agentic_ai_dev", "science"],
-            },
-            # AI Business News (current sources)
-            "techcrunch_ai": {
-                "url": "https://techcrunch.com/category/artificial-intelligence/feed/",
-                "categories": ["agentic_ai_business", "tech", "business"],
-            },
-            "venturebeat_ai": {
-                "url": "https://venturebeat.com/category/ai/feed/",
-                "categories": ["agentic_ai_business", "tech"],
-            },
-            "mit_tech_ai": {
-                "url": "https://www.technologyreview.com/topic/artificial-intelligence/feed",
-                "categories": ["agentic_ai_business", "tech"],
-            },
-            # General Tech & Business
-            "techcrunch": {
-                "url": "https://techcrunch.com/feed/",
-                "categories": ["tech", "business"],
-            },
-            "bbc_tech": {
-                "url": "https://feeds.bbci.co.uk/news/technology/rss.xml",
-                "categories": ["tech"],
-            },
-            "bbc_us": {
-                "url": "https://feeds.bbci.co.uk/news/world/us_and_canada/rss.xml",
-                "categories": ["us", "world"],
-            },
-            "bbc_world": {
-                "url": "https://feeds.bbci.co.uk/news/world/rss.xml",
-                "categories": ["world"],
-            },
-            "bbc_business": {
-                "url": "https://feeds.bbci.co.uk/news/business/rss.xml",
-                "categories": ["business"],
-            },
-            "bbc_science": {
-                "url": "https://feeds.bbci.co.uk/news/science_and_environment/rss.xml",
-                "categories": ["science"],
-            },
-            "bbc_sport": {
-                "url": "https://feeds.bbci.co.uk/sport/rss.xml",
-                "categories": ["sports"],
-            },
-            "bbc_entertainment": {
-                "url": "https://feeds.bbci.co.uk/news/entertainment_and_arts/rss.xml",
-                "categories": ["entertainment"],
-            },
-            "cnn_us": {
-                "url": "http://rss.cnn.com/rss/cnn_us.rss",
-                "categories": ["us"],
-            },
-            "cnn_world": {
-                "url": "http://rss.cnn.com/rss/cnn_world.rss",
-                "categories": ["world"],
-            },
-            "cnn_tech": {
-                "url": "http://rss.cnn.com/rss/cnn_tech.rss",
-                "categories": ["tech"],
-            },
-            "reuters_business": {
-                "url": "https://www.reuters.com/finance",
-                "categories": ["business"],
-            },
-            "guardian_world": {
-                "url": "https://www.theguardian.com/world/rss",
-                "categories": ["world"],
-            },
-            "guardian_us": {
-                "url": "https://www.theguardian.com/us-news/rss",
-                "categories": ["us"],
-            },
-            "guardian_tech": {
-                "url": "https://www.theguardian.com/technology/rss",
-                "categories": ["tech"],
-            },
-            "bbc_health": {
-                "url": "https://feeds.bbci.co.uk/news/health/rss.xml",
-                "categories": ["science"],
-            },
-            "wired_tech": {
-                "url": "https://www.wired.com/feed/rss",
-                "categories": ["tech"],
-            },
+            name: {"url": feed["url"], "categories": list(feed["categories"])}
+            for name, feed in _DEFAULT_RSS_FEEDS.items()
         }
     
     @staticmethod
@@ -197,6 +213,7 @@ class ConfigManager:
         self.news = NewsConfig()
         
         self._load_config()
+        self.rebuild_feed_index()
     
     def _find_config(self) -> Path:
         """Find config file, creating from template if needed."""
@@ -220,8 +237,7 @@ class ConfigManager:
             return
         
         try:
-            with open(self.config_path, "r") as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = self._read_yaml()
             
             # Load UI config
             if "ui" in config_data:
@@ -249,27 +265,88 @@ class ConfigManager:
         except Exception as e:
             logger.error(f"Failed to load config: {e}, using defaults")
     
-    def save_config(self) -> None:
-        """Save current configuration to YAML file."""
-        config_data = {
+    def _read_yaml(self) -> dict:
+        """Parse the config file, reusing the result while it is unchanged on disk."""
+        key = (str(self.config_path.resolve()), self.config_path.stat().st_mtime_ns)
+        data = _YAML_CACHE.get(key)
+        if data is None:
+            with open(self.config_path, "r") as f:
+                data = yaml.load(f, Loader=_YamlLoader) or {}
+            _YAML_CACHE[key] = data
+        # Callers mutate the loaded config (e.g. feed edits), so never hand out the cached dict
+        return copy.deepcopy(data)
+    
+    def config_snapshot(self) -> dict:
+        """Return a deep copy of the configuration as it would be written.
+        
+        The copy is safe to serialize on another thread while the live
+        feed dicts keep changing. The category lookup tables are rebuilt
+        as well, so feed edits are visible to ``get_feeds_for_category``.
+        """
+        self.rebuild_feed_index()
+        return {
             "ui": asdict(self.ui),
             "cache": asdict(self.cache),
             "log": asdict(self.log),
             "news": {
-                "rss_feeds": self.news.rss_feeds,
-                "scraping_sources": self.news.scraping_sources,
+                "rss_feeds": copy.deepcopy(self.news.rss_feeds),
+                "scraping_sources": copy.deepcopy(self.news.scraping_sources),
                 "api_key": self.news.api_key,
             }
         }
+    
+    def save_config(self, config_data: Optional[dict] = None) -> None:
+        """Save current configuration to YAML file.
+        
+        ``config_data`` is a snapshot from ``config_snapshot``; when omitted
+        one is taken now.
+        """
+        if config_data is None:
+            config_data = self.config_snapshot()
         
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_path, "w") as f:
-                yaml.dump(config_data, f, default_flow_style=False)
+                yaml.dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            # Don't trust mtime alone when the file is rewritten within one timestamp tick
+            path = str(self.config_path.resolve())
+            for key in [k for k in _YAML_CACHE if k[0] == path]:
+                del _YAML_CACHE[key]
             logger.info(f"Configuration saved to {self.config_path}")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
     
+    def rebuild_feed_index(self) -> None:
+        """Rebuild the category lookup tables from the current feed config.
+        
+        Must be called after ``news.rss_feeds`` or ``news.scraping_sources``
+        are modified in place.
+        """
+        cat_to_feeds: Dict[str, List[Dict[str, str]]] = {}
+        for feed_name, feed_config in self.news.rss_feeds.items():
+            entry = {"name": feed_name, "url": feed_config["url"]}
+            for category in feed_config.get("categories", []):
+                cat_to_feeds.setdefault(category, []).append(entry)
+        
+        cat_to_sources: Dict[str, List[Dict]] = {}
+        for source_name, source_config in self.news.scraping_sources.items():
+            entry = {
+                "name": source_name,
+                "url": source_config["url"],
+                "selectors": source_config.get("selectors", {}),
+            }
+            for category in source_config.get("categories", []):
+                cat_to_sources.setdefault(category, []).append(entry)
+        
+        self._cat_to_feeds = cat_to_feeds
+        self._cat_to_sources = cat_to_sources
+        # Checked once here so callers don't rescan every URL
+        self._all_urls_http = all(
+            cfg["url"].startswith("http")
+            for sources in (self.news.rss_feeds, self.news.scraping_sources)
+            for cfg in sources.values()
+        )
+    
     def get_feeds_for_category(self, category: str) -> List[Dict[str, str]]:
         """Get RSS feeds for a specific category.
         
@@ -277,25 +354,11 @@ class ConfigManager:
             category: Category name (e.g., "tech", "us")
         
         Returns:
-            List of feed configurations matching the category
+            List of feed configurations matching the category; a fresh
+            list, so callers may modify it without touching the index
         """
-        feeds = []
-        for feed_name, feed_config in self.news.rss_feeds.items():
-            if category in feed_config.get("categories", []):
-                feeds.append({
-                    "name": feed_name,
-                    "url": feed_config["url"],
-                })
-        return feeds
+        return list(self._cat_to_feeds.get(category, ()))
     
     def get_scraping_sources_for_category(self, category: str) -> List[Dict]:
         """Get scraping sources for a specific category."""
-        sources = []
-        for source_name, source_config in self.news.scraping_sources.items():
-            if category in source_config.get("categories", []):
-                sources.append({
-                    "name": source_name,
-                    "url": source_config["url"],
-                    "selectors": source_config.get("selectors", {}),
-                })
-        return sources
+        return list(self._cat_to_sources.get(category, ()))
@@ -1,23 +1,49 @@
 """Terminal News Application - Main Entry Point"""
 
 import sys
+import time
 import asyncio
 import logging
+from contextlib import aclosing
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+from textual import work
 from textual.app import ComposeResult, App
-from textual.widgets import Header, Footer, Static, Button, Label
+from textual.widgets import Header, Footer, Static, Button, Label, ListView
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
+from textual.css.query import NoMatches
 from textual.message import Message
 
 from .config import ConfigManager
 from .api import NewsHandler
 from .cache import CacheManager
 from .models import AppState, Category, Article
+from .ui import ArticleListItem
 from .ui.settings import SettingsView, BackToDashboardMessage
 
 
 logger = logging.getLogger(__name__)
 
+# Seconds a category's articles are served from memory before asking SQLite again
+MEM_CACHE_TTL = 60
+
+# Sidebar order, used to warm the categories a user is likely to open next
+SIDEBAR_CATEGORIES = (
+    Category.BREAKING,
+    Category.AGENTIC_AI_DEV,
+    Category.AGENTIC_AI_BUS,
+    Category.US,
+    Category.WORLD,
+    Category.TECH,
+    Category.BUSINESS,
+    Category.SCIENCE,
+)
+PREFETCH_COUNT = 2
+PREFETCH_DELAY = 0.5
+
+DETAIL_RULE = "─" * 60
+
 
 class NewsAppUI(App):
     """Main Textual application for NewsApp."""
@@ -25,12 +51,42 @@ class NewsAppUI(App):
     TITLE = "Terminal News Application"
     SUBTITLE = "v0.1.0"
     
+    # Dispatch tables, built once per class rather than per event
+    _CATEGORY_MAP = {
+        "cat-breaking": Category.BREAKING,
+        "cat-agentic-dev": Category.AGENTIC_AI_DEV,
+        "cat-agentic-bus": Category.AGENTIC_AI_BUS,
+        "cat-us": Category.US,
+        "cat-world": Category.WORLD,
+        "cat-tech": Category.TECH,
+        "cat-business": Category.BUSINESS,
+        "cat-science": Category.SCIENCE,
+    }
+    _BTN_HANDLERS = {
+        "settings-btn": "_show_settings",
+        "refresh-btn": "_refresh",
+        "quit-btn": "exit",
+    }
+    _ART_PREFIX = "article-"
+    _ART_PREFIX_LEN = len(_ART_PREFIX)
+    _KEY_CATEGORIES = {
+        "1": Category.US,
+        "2": Category.WORLD,
+        "3": Category.TECH,
+        "4": Category.BUSINESS,
+        "5": Category.SCIENCE,
+    }
+    
     CSS = """
     #main-container {
         height: 1fr;
         layout: vertical;
     }
     
+    #dashboard-root, #settings-root {
+        height: 1fr;
+    }
+    
     #content-area {
         height: 1fr;
         layout: horizontal;
@@ -76,10 +132,11 @@ class NewsAppUI(App):
         margin: 0 0;
     }
     
-    .article-btn {
-        width: 100%;
-        height: auto;
-        text-align: left;
+    #articles-listview {
+        height: 1fr;
+    }
+    
+    .article-item {
         margin: 0 0 1 0;
     }
     
@@ -93,139 +150,228 @@ class NewsAppUI(App):
         super().__init__()
         self.cfg = ConfigManager()
         self.cache = CacheManager(db_path=self.cfg.cache.location)
-        self.handler = NewsHandler()
+        http_cache_dir = None
+        if self.cfg.cache.enabled:
+            http_cache_dir = str(Path(self.cfg.cache.location).parent / "http_cache")
+        self.handler = NewsHandler(http_cache_dir=http_cache_dir)
         self.state = AppState()
         self.articles = []
         self.current_view = "dashboard"  # "dashboard" or "settings"
         self.article_view_mode = "list"  # "list" or "detail"
         self.selected_article = None
+        # Recently shown articles per category, keyed to a monotonic timestamp
+        self._mem_cache: Dict[Category, Tuple[float, List[Article]]] = {}
     
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header(show_clock=True)
         
         with Container(id="main-container"):
-            # Two-column layout: categories on left, content on right
-            with Horizontal(id="content-area"):
-                # Left panel: Categories
-                with Vertical(id="categories-panel"):
-                    yield Label("📂 Categories", id="categories-header")
-                    yield Button("🌟 Breaking News", id="cat-breaking")
-                    yield Button("🤖 Agentic AI Developer", id="cat-agentic-dev")
-                    yield Button("💼 Agentic AI Business", id="cat-agentic-bus")
-                    yield Button("🗽 US News", id="cat-us")
-                    yield Button("🌍 World", id="cat-world")
-                    yield Button("💻 Tech", id="cat-tech")
-                    yield Button("💼 Business", id="cat-business")
-                    yield Button("🔬 Science", id="cat-science")
+            # Dashboard and settings stay mounted; switching views only toggles display
+            with Vertical(id="dashboard-root"):
+                # Two-column layout: categories on left, content on right
+                with Horizontal(id="content-area"):
+                    # Left panel: Categories
+                    with Vertical(id="categories-panel"):
+                        yield Label("📂 Categories", id="categories-header")
+                        yield Button("🌟 Breaking News", id="cat-breaking")
+                        yield Button("🤖 Agentic AI Developer", id="cat-agentic-dev")
+                        yield Button("💼 Agentic AI Business", id="cat-agentic-bus")
+                        yield Button("🗽 US News", id="cat-us")
+                        yield Button("🌍 World", id="cat-world")
+                        yield Button("💻 Tech", id="cat-tech")
+                        yield Button("💼 Business", id="cat-business")
+                        yield Button("🔬 Science", id="cat-science")
+                    
+                    # Right panel: Articles content
+                    with ScrollableContainer(id="articles-panel"):
+                        yield Static("Select a category to view articles", id="articles-list")
                 
-                # Right panel: Articles content
-                with ScrollableContainer(id="articles-panel"):
-                    yield Static("Select a category to view articles", id="articles-list")
+                # Bottom bar with controls
+                with Horizontal(id="top-bar"):
+                    yield Button("⚙️  [b][cyan]S[/cyan][/b]ettings", id="settings-btn")
+                    yield Button("🔄 [b][cyan]R[/cyan][/b]efresh", id="refresh-btn")
+                    yield Button("🚪 [b][cyan]Q[/cyan][/b]uit", id="quit-btn")
             
-            # Bottom bar with controls
-            with Horizontal(id="top-bar"):
-                yield Button("⚙️  [b][cyan]S[/cyan][/b]ettings", id="settings-btn")
-                yield Button("🔄 [b][cyan]R[/cyan][/b]efresh", id="refresh-btn")
-                yield Button("🚪 [b][cyan]Q[/cyan][/b]uit", id="quit-btn")
+            # Settings view is mounted here the first time it is opened
+            settings_root = Container(id="settings-root")
+            settings_root.display = False
+            yield settings_root
         
         yield Footer()
     
     def on_mount(self) -> None:
         """Initialize application on mount."""
         self.title = "Terminal News Application v0.1.0"
+        # The dashboard is never remounted, so these lookups only need doing once
+        self._articles_panel = self.query_one("#articles-panel", ScrollableContainer)
+        self._dashboard_root = self.query_one("#dashboard-root", Vertical)
+        self._settings_root = self.query_one("#settings-root", Container)
         self._load_category(Category.US)
         # Set initial focus on first category button
         try:
             first_button = self.query("#categories-panel Button").first()
             if first_button:
                 first_button.focus()
-        except:
+        except NoMatches:
             pass
     
-    def _load_category(self, category: Category) -> None:
-        """Load articles for a category."""
-        async def fetch():
-            feeds = self.cfg.get_feeds_for_category(category.value)
-            scraping = self.cfg.get_scraping_sources_for_category(category.value)
-            
-            # Try cache first
-            cached = self.cache.get_articles(category=category, max_age_hours=6, limit=20)
-            if cached:
-                return cached
-            
-            # Fetch from sources
-            articles = await self.handler.fetch_category(feeds, scraping, category, limit_per_source=5)
-            if articles:
-                self.cache.save_articles(articles)
-            return articles
+    async def on_unmount(self) -> None:
+        """Release network resources on shutdown."""
+        await self.handler.close()
+    
+    @work(exclusive=True, group="category")
+    async def _load_category(self, category: Category) -> None:
+        """Load articles for a category, cancelling any load still in flight."""
+        self.state.current_category = category
+        articles_panel = self._articles_panel
+        try:
+            articles = await self._cached_articles(category)
+            if articles is None:
+                await self._stream_articles(category)
+            else:
+                await self._show_articles(category, articles)
+        except Exception as e:
+            await articles_panel.remove_children()
+            articles_panel.mount(Static(f"Error loading articles: {e}"))
+            return
+        self.set_timer(PREFETCH_DELAY, lambda: self._prefetch_after(category))
+    
+    async def _show_articles(self, category: Category, articles: List[Article]) -> None:
+        """Replace the article panel with a complete list."""
+        articles_panel = self._articles_panel
+        self.articles = articles
+        self.article_view_mode = "list"
+        
+        # Wait for the old list to go so its id is free for the new one
+        await articles_panel.remove_children()
         
-        # Run async fetch
-        task = asyncio.create_task(fetch())
-        self._update_display(task, category)
+        header = Static(f"📂 {category.value.upper()} NEWS ({len(articles)} articles)\n")
+        
+        if not articles:
+            body = Static("No articles found. Check your connection or try another category.")
+        else:
+            # One ListView holds every article, so we mount a single widget per refresh
+            max_len = self.cfg.ui.max_headline_length
+            body = ListView(
+                *[
+                    ArticleListItem(article, i, article.headline[:max_len], article.source[:15])
+                    for i, article in enumerate(articles)
+                ],
+                id="articles-listview",
+            )
+        articles_panel.mount_all((header, body))
     
-    def _update_display(self, task, category: Category) -> None:
-        """Update display with fetched articles."""
-        async def update():
+    async def _stream_articles(self, category: Category) -> None:
+        """Fetch a category from its sources, adding rows as each source is parsed."""
+        articles_panel = self._articles_panel
+        articles: List[Article] = []
+        self.articles = articles
+        self.article_view_mode = "list"
+        
+        await articles_panel.remove_children()
+        label = category.value.upper()
+        header = Static(f"📂 {label} NEWS (loading...)\n")
+        list_view = ListView(id="articles-listview")
+        await articles_panel.mount_all((header, list_view))
+        
+        feeds = self.cfg.get_feeds_for_category(category.value)
+        scraping = self.cfg.get_scraping_sources_for_category(category.value)
+        max_len = self.cfg.ui.max_headline_length
+        stream = self.handler.stream_category(feeds, scraping, category, limit_per_source=5)
+        async with aclosing(stream):
+            async for article in stream:
+                index = len(articles)
+                articles.append(article)
+                list_view.append(ArticleListItem(article, index, article.headline[:max_len], article.source[:15]))
+                header.update(f"📂 {label} NEWS ({len(articles)} articles)\n")
+        
+        if not articles:
+            header.update(f"📂 {label} NEWS (0 articles)\n")
+            await list_view.remove()
+            articles_panel.mount(Static("No articles found. Check your connection or try another category."))
+            return
+        await asyncio.to_thread(self.cache.save_articles, articles)
+        self._mem_cache[category] = (time.monotonic(), articles)
+    
+    @work(exclusive=True, group="prefetch")
+    async def _prefetch_after(self, category: Category) -> None:
+        """Warm the in-memory cache with the categories after this one in the sidebar."""
+        if category not in SIDEBAR_CATEGORIES:
+            return
+        start = SIDEBAR_CATEGORIES.index(category)
+        for offset in range(1, PREFETCH_COUNT + 1):
+            # Back off as soon as the user asks for something
+            if any(w.group == "category" and w.is_running for w in self.workers):
+                return
+            nxt = SIDEBAR_CATEGORIES[(start + offset) % len(SIDEBAR_CATEGORIES)]
             try:
-                articles = await task
-                self.articles = articles
-                self.article_view_mode = "list"
-                
-                # Update UI with article list
-                articles_panel = self.query_one("#articles-panel", ScrollableContainer)
-                articles_panel.remove_children()
-                
-                # Add header
-                header = Static(f"📂 {category.value.upper()} NEWS ({len(articles)} articles)\n")
-                articles_panel.mount(header)
-                
-                if not articles:
-                    articles_panel.mount(Static("No articles found. Check your connection or try another category."))
-                else:
-                    # Create clickable buttons for each article
-                    for i, article in enumerate(articles[:15], 1):
-                        headline = article.headline[:self.cfg.ui.max_headline_length]
-                        source = article.source[:15]
-                        btn = Button(f"{i}. {headline}\n   📍 {source}", id=f"article-{i-1}", classes="article-btn")
-                        articles_panel.mount(btn)
+                await self._fetch_articles(nxt)
             except Exception as e:
-                articles_panel = self.query_one("#articles-panel", ScrollableContainer)
-                articles_panel.remove_children()
-                articles_panel.mount(Static(f"Error loading articles: {e}"))
+                logger.debug(f"Prefetch of {nxt.value} failed: {e}")
+    
+    async def _cached_articles(self, category: Category) -> Optional[List[Article]]:
+        """Return articles for a category from memory or SQLite, or None on a miss."""
+        hit = self._mem_cache.get(category)
+        if hit and time.monotonic() - hit[0] < MEM_CACHE_TTL:
+            return hit[1]
+        
+        # Off the event loop so disk I/O can't stall the UI
+        cached = await asyncio.to_thread(self.cache.get_articles, category=category, max_age_hours=6, limit=50)
+        if cached:
+            self._mem_cache[category] = (time.monotonic(), cached)
+            return cached
+        return None
+    
+    async def _fetch_articles(self, category: Category) -> List[Article]:
+        """Return articles for a category from memory, SQLite, or the network."""
+        cached = await self._cached_articles(category)
+        if cached is not None:
+            return cached
         
-        asyncio.create_task(update())
+        feeds = self.cfg.get_feeds_for_category(category.value)
+        scraping = self.cfg.get_scraping_sources_for_category(category.value)
+        articles = await self.handler.fetch_category(feeds, scraping, category, limit_per_source=5)
+        if articles:
+            await asyncio.to_thread(self.cache.save_articles, articles)
+            self._mem_cache[category] = (time.monotonic(), articles)
+        return articles
+    
+    def _refresh(self) -> None:
+        """Reload the current category, bypassing the in-memory cache."""
+        self._mem_cache.pop(self.state.current_category, None)
+        self._load_category(self.state.current_category)
     
     def _show_article_detail(self, article: Article) -> None:
         """Show detail view of an article."""
         self.article_view_mode = "detail"
         self.selected_article = article
         
-        articles_panel = self.query_one("#articles-panel", ScrollableContainer)
+        articles_panel = self._articles_panel
         articles_panel.remove_children()
         
-        # Article detail view
-        detail_content = f"""[b]{article.headline}[/b]
-
-📍 Source: {article.source}
-⏰ Published: {article.published_at or 'Unknown'}
-✍️  Author: {article.author or 'Unknown'}
-🏷️  Tags: {', '.join(article.tags) if article.tags else 'None'}
-
-{'─' * 60}
-
-{article.content or article.summary or 'No content available'}
-
-{'─' * 60}
-
-"""
-        
-        articles_panel.mount(Static(detail_content))
-        
-        # Display URL
-        articles_panel.mount(Static(f"\n🔗 {article.url}\n"))
-        
-        articles_panel.mount(Static("\n[dim]Press ESC or Backspace to go back to the list[/dim]"))
+        # Article detail view, assembled in one join and shown in a single widget
+        parts = [
+            f"[b]{article.headline}[/b]",
+            "",
+            f"📍 Source: {article.source}",
+            f"⏰ Published: {article.published_at or 'Unknown'}",
+            f"✍️  Author: {article.author or 'Unknown'}",
+            f"🏷️  Tags: {', '.join(article.tags) if article.tags else 'None'}",
+            "",
+            DETAIL_RULE,
+            "",
+            article.display_text or 'No content available',
+            "",
+            DETAIL_RULE,
+            "",
+            "",
+            f"🔗 {article.url}",
+            "",
+            "",
+            "[dim]Press ESC or Backspace to go back to the list[/dim]",
+        ]
+        articles_panel.mount(Static("\n".join(parts)))
     
     def action_quit(self) -> None:
         """Handle quit action."""
@@ -237,34 +383,25 @@ class NewsAppUI(App):
         
         logger.info(f"Button pressed: {button_id}")
         
-        if button_id == "settings-btn":
-            self._show_settings()
-        elif button_id == "refresh-btn":
-            self._load_category(self.state.current_category)
-        elif button_id == "quit-btn":
-            self.exit()
-        elif button_id and button_id.startswith("article-"):
-            # Handle article click
+        category = self._CATEGORY_MAP.get(button_id)
+        if category is not None:
+            self._load_category(category)
+            return
+        handler = self._BTN_HANDLERS.get(button_id)
+        if handler is not None:
+            getattr(self, handler)()
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        """Open the selected article."""
+        item_id = event.item.id
+        if item_id and item_id.startswith(self._ART_PREFIX):
             try:
-                article_index = int(button_id.split("-")[1])
+                article_index = int(item_id[self._ART_PREFIX_LEN:])
                 if 0 <= article_index < len(self.articles):
                     self._show_article_detail(self.articles[article_index])
             except (ValueError, IndexError):
                 pass
-        else:
-            category_map = {
-                "cat-breaking": Category.BREAKING,
-                "cat-agentic-dev": Category.AGENTIC_AI_DEV,
-                "cat-agentic-bus": Category.AGENTIC_AI_BUS,
-                "cat-us": Category.US,
-                "cat-world": Category.WORLD,
-                "cat-tech": Category.TECH,
-                "cat-business": Category.BUSINESS,
-                "cat-science": Category.SCIENCE,
-            }
-            if button_id in category_map:
-                self._load_category(category_map[button_id])
-
+    
     def on_key(self, event) -> None:
         """Handle keyboard shortcuts."""
         if event.key in ["escape", "backspace"]:
@@ -277,7 +414,7 @@ class NewsAppUI(App):
             self._show_settings()
         elif event.key == "r":
             if self.current_view == "dashboard":
-                self._load_category(self.state.current_category)
+                self._refresh()
         elif event.key == "q":
             self.exit()
         elif event.key == "left":
@@ -286,79 +423,34 @@ class NewsAppUI(App):
                 categories = self.query("#categories-panel Button").first()
                 if categories:
                     categories.focus()
-            except:
+            except NoMatches:
                 pass
         elif event.key == "right":
             # Focus on articles panel
-            try:
-                articles = self.query_one("#articles-panel")
-                if articles:
-                    articles.focus()
-            except:
-                pass
+            self._articles_panel.focus()
         elif event.key in ["up", "down"]:
             # Let Textual handle navigation between buttons
             pass
         elif self.current_view == "dashboard":
-            key_map = {
-                "1": Category.US,
-                "2": Category.WORLD,
-                "3": Category.TECH,
-                "4": Category.BUSINESS,
-                "5": Category.SCIENCE,
-            }
-            cat = key_map.get(event.key)
+            cat = self._KEY_CATEGORIES.get(event.key)
             if cat:
                 self._load_category(cat)
     
     def _show_settings(self) -> None:
         """Show settings view."""
         self.current_view = "settings"
-        main_container = self.query_one("#main-container", Container)
-        main_container.remove_children()
-        
-        settings_view = SettingsView(self.cfg)
-        main_container.mount(settings_view)
+        if not self._settings_root.children:
+            self._settings_root.mount(SettingsView(self.cfg))
+        self._dashboard_root.display = False
+        self._settings_root.display = True
     
     def _show_dashboard(self) -> None:
         """Return to dashboard view."""
         self.current_view = "dashboard"
-        main_container = self.query_one("#main-container", Container)
-        main_container.remove_children()
-        
-        # Rebuild dashboard UI with two-column layout and bottom bar
-        with main_container:
-            # Two-column layout
-            content_area = Horizontal(id="content-area")
-            
-            # Left panel: Categories
-            categories_panel = Vertical(id="categories-panel")
-            categories_panel.mount(Label("📂 Categories", id="categories-header"))
-            categories_panel.mount(Button("🌟 Breaking News", id="cat-breaking"))
-            categories_panel.mount(Button("🤖 Agentic AI Developer", id="cat-agentic-dev"))
-            categories_panel.mount(Button("💼 Agentic AI Business", id="cat-agentic-bus"))
-            categories_panel.mount(Button("🗽 US News", id="cat-us"))
-            categories_panel.mount(Button("🌍 World", id="cat-world"))
-            categories_panel.mount(Button("💻 Tech", id="cat-tech"))
-            categories_panel.mount(Button("💼 Business", id="cat-business"))
-            categories_panel.mount(Button("🔬 Science", id="cat-science"))
-            content_area.mount(categories_panel)
-            
-            # Right panel: Articles
-            articles_panel = ScrollableContainer(id="articles-panel")
-            articles_panel.mount(Static("Select a category to view articles", id="articles-list"))
-            content_area.mount(articles_panel)
-            
-            main_container.mount(content_area)
-            
-            # Bottom bar with controls
-            bottom_bar = Horizontal(id="top-bar")
-            bottom_bar.mount(Button("⚙️  [b][cyan]S[/cyan][/b]ettings", id="settings-btn"))
-            bottom_bar.mount(Button("🔄 [b][cyan]R[/cyan][/b]efresh", id="refresh-btn"))
-            bottom_bar.mount(Button("🚪 [b][cyan]Q[/cyan][/b]uit", id="quit-btn"))
-            main_container.mount(bottom_bar)
+        self._settings_root.display = False
+        self._dashboard_root.display = True
         
-        # Reload current category
+        # Reload current category in case its feeds were edited
         self._load_category(self.state.current_category)
     
     def on_back_to_dashboard_message(self, message: BackToDashboardMessage) -> None:
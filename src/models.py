@@ -42,10 +42,14 @@ class Category(str, Enum):
     
     def __str__(self) -> str:
         """Return readable category name."""
-        return self.value.replace("_", " ").title()
+        return _CATEGORY_DISPLAY[self._value_]
 
 
-@dataclass
+# Display names are built once; keyed by value to skip Enum.__hash__
+_CATEGORY_DISPLAY = {c.value: c.value.replace("_", " ").title() for c in Category}
+
+
+@dataclass(slots=True, frozen=True)
 class FeedConfig:
     """Configuration for a single news feed."""
     
@@ -57,7 +61,7 @@ class FeedConfig:
     timeout: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Represents a single news article."""
     
@@ -79,12 +83,18 @@ class Article:
     is_bookmarked: bool = False
     cached_at: Optional[datetime] = None
     
+    # Text for the detail view, derived from content/summary; refresh it when content changes
+    display_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.display_text = self.content or self.summary or None
+    
     def __hash__(self):
         """Allow use as dict key."""
         return hash(self.id)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Global application state."""
     
@@ -98,7 +108,7 @@ class AppState:
     last_refresh: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CacheMetadata:
     """Metadata about cached content."""
     
@@ -1,8 +1,9 @@
 """Dashboard view components for NewsApp using Textual."""
 
-from typing import List
+from typing import List, Optional
 import logging
 
+from rich.text import Text
 from textual.widgets import Static, ListView, ListItem
 from textual import events
 from textual.reactive import Reactive
@@ -12,18 +13,61 @@ from ..models import Article
 logger = logging.getLogger(__name__)
 
 
+# Row layout: status, position, headline, source (bound method avoids a lookup per row)
+_ROW_TEMPLATE = "{} {}. {}\n   📍 {}".format
+
+
+class ArticleLabel(Static):
+    """Two-line article label whose text is only built once it is painted.
+
+    The height is fixed in CSS, so layout never has to render the label to
+    measure it and rows scrolled out of view cost nothing.
+    """
+
+    DEFAULT_CSS = """
+    ArticleLabel {
+        height: 2;
+    }
+    """
+
+    def __init__(self, article: Article, index: int, headline: str, source: str):
+        super().__init__(markup=False)
+        self.article = article
+        self.index = index
+        self.headline = headline
+        self.source = source
+        self._text: Optional[Text] = None
+
+    def render(self) -> Text:
+        if self._text is None:
+            article = self.article
+            status = "🔖" if article.is_bookmarked else ("✓" if article.is_read else " ")
+            self._text = Text(
+                _ROW_TEMPLATE(status, self.index + 1, self.headline, self.source),
+                no_wrap=True,
+                overflow="ellipsis",
+            )
+        return self._text
+
+
 class ArticleListItem(ListItem):
     """List item representing a single article."""
 
-    def __init__(self, article: Article):
-        super().__init__()
+    def __init__(
+        self,
+        article: Article,
+        index: int = 0,
+        headline: Optional[str] = None,
+        source: Optional[str] = None,
+    ):
+        # Callers rendering many rows pass pre-truncated display strings
+        if headline is None:
+            headline = article.headline
+        if source is None:
+            source = article.source[:15]
+        super().__init__(ArticleLabel(article, index, headline, source), id=f"article-{index}", classes="article-item")
         self.article = article
-        self.refresh()
-
-    def refresh(self):
-        title = self.article.headline
-        status = "🔖" if self.article.is_bookmarked else ("✓" if self.article.is_read else " ")
-        self.set_label(f"{status} {title}")
+        self.index = index
 
 
 class HeadlineListView(Static):
@@ -38,8 +82,8 @@ class HeadlineListView(Static):
     def set_articles(self, articles: List[Article]):
         self.articles = articles
         self.list.clear()
-        for a in articles:
-            self.list.append(ArticleListItem(a))
+        for i, a in enumerate(articles):
+            self.list.append(ArticleListItem(a, i))
 
 
 class CategorySelector(Static):
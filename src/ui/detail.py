@@ -27,7 +27,7 @@ class ArticleContentView(ScrollableContainer):
         self.update_content()
 
     def update_content(self):
-        content = self.article.content or self.article.summary or "(no content)"
+        content = self.article.display_text or "(no content)"
         self.update(content)
 
 
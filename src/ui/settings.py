@@ -1,18 +1,26 @@
 """Settings view for NewsApp - manage feed URLs."""
 
+import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, Final, List, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
 from textual.widgets import Static, Button, Input, Label, Select
 from textual.message import Message
+from textual.timer import Timer
 
 from ..config import ConfigManager
 from ..models import Category
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for further Save clicks before writing the config file
+SAVE_DELAY = 0.2
+
+# Category selector options as (label, value), built once at import
+_CATEGORY_OPTIONS: Final[Tuple[Tuple[str, str], ...]] = tuple((c.value.upper(), c.value) for c in Category)
+
 
 class BackToDashboardMessage(Message):
     """Message to go back to dashboard."""
@@ -34,7 +42,16 @@ class SettingsView(Static):
         self.config = config
         self.feeds_container = None
         self.current_category = Category.US
-        self.feed_inputs: Dict[str, Input] = {}
+        # Feed names and their URL inputs, kept in display order
+        self._feed_names: List[str] = []
+        self._feed_widgets: List[Input] = []
+        # Pending debounced config write, if any
+        self._save_timer: Optional[Timer] = None
+    
+    @property
+    def feed_inputs(self) -> Dict[str, Input]:
+        """Feed URL inputs keyed by feed name."""
+        return dict(zip(self._feed_names, self._feed_widgets))
     
     def compose(self) -> ComposeResult:
         """Create settings UI."""
@@ -44,9 +61,8 @@ class SettingsView(Static):
                 yield Label("Select a category and edit RSS feed URLs:")
                 
                 # Category selector - using tuples of (label, value)
-                categories = [(c.value.upper(), c.value) for c in Category]
                 select_widget = Select(
-                    options=categories,
+                    options=_CATEGORY_OPTIONS,
                     prompt="Select Category",
                     id="category-select"
                 )
@@ -63,22 +79,24 @@ class SettingsView(Static):
                     yield Button("+ Add Feed", id="add-feed-btn")
                     yield Button("← Back", id="back-btn")
     
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Initialize settings view."""
-        self._update_feeds_display()
+        await self._update_feeds_display()
     
-    def on_select_changed(self, event: Select.Changed) -> None:
+    async def on_select_changed(self, event: Select.Changed) -> None:
         """Handle category selection change."""
         try:
             self.current_category = Category(event.value)
-            self._update_feeds_display()
+            await self._update_feeds_display()
         except Exception as e:
             logger.error(f"Error changing category: {e}")
     
-    def _update_feeds_display(self) -> None:
+    async def _update_feeds_display(self) -> None:
         """Update feeds display for current category."""
-        self.feed_inputs.clear()
-        self.feeds_container.remove_children()
+        self._feed_names.clear()
+        self._feed_widgets.clear()
+        # Old inputs must be gone before new ones reuse their ids
+        await self.feeds_container.remove_children()
         
         feeds = self.config.get_feeds_for_category(self.current_category.value)
         
@@ -86,22 +104,20 @@ class SettingsView(Static):
             self.feeds_container.mount(Label("No feeds configured for this category"))
             return
         
+        # Build every row first so the container lays out once
+        widgets = []
         for feed_info in feeds:
-            feed_name = feed_info.get('name', 'Unknown')
-            feed_url = feed_info.get('url', '')
-            
-            # Create label for feed name
-            label = Label(f"📰 {feed_name}")
-            self.feeds_container.mount(label)
-            
-            # Create input field for feed URL
-            feed_input = Input(value=feed_url, id=f"feed-{feed_name}")
-            self.feeds_container.mount(feed_input)
-            self.feed_inputs[feed_name] = feed_input
-            
-            # Add spacer
-            spacer = Static("", height=1)
-            self.feeds_container.mount(spacer)
+            widgets.extend(self._feed_row(feed_info.get('name', 'Unknown'), feed_info.get('url', '')))
+        
+        self.feeds_container.mount_all(widgets)
+    
+    def _feed_row(self, feed_name: str, feed_url: str) -> Tuple[Label, Input, Static]:
+        """Create the widgets for one feed and register its input."""
+        feed_input = Input(value=feed_url, id=f"feed-{feed_name}")
+        self._feed_names.append(feed_name)
+        self._feed_widgets.append(feed_input)
+        # Label for feed name, URL input, then a blank spacer line
+        return Label(f"📰 {feed_name}"), feed_input, Static("")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -114,47 +130,75 @@ class SettingsView(Static):
             self._save_feeds()
         
         elif button_id == "add-feed-btn":
-            self._add_new_feed()
+            self.call_later(self._add_new_feed)
     
     def _save_feeds(self) -> None:
         """Save modified feed URLs back to config."""
         try:
             # Update the feeds in config
-            for feed_name, feed_input in self.feed_inputs.items():
-                new_url = feed_input.value
-                
-                # Find and update the feed in config
-                if feed_name in self.config.news.rss_feeds:
-                    self.config.news.rss_feeds[feed_name]['url'] = new_url
-                    logger.info(f"Updated feed {feed_name}: {new_url}")
-            
-            # Save to YAML file
-            self.config.save_config()
+            rss_feeds = self.config.news.rss_feeds
+            log_updates = logger.isEnabledFor(logging.INFO)
+            for feed_name, feed_input in zip(self._feed_names, self._feed_widgets):
+                entry = rss_feeds.get(feed_name)
+                if entry is not None:
+                    new_url = feed_input.value
+                    entry['url'] = new_url
+                    if log_updates:
+                        logger.info(f"Updated feed {feed_name}: {new_url}")
+            self.config.rebuild_feed_index()
+        except Exception as e:
+            logger.error(f"Error saving settings: {e}")
+            self.feeds_container.mount(Label(f"❌ Error saving: {e}"))
+            return
+        
+        # Coalesce rapid clicks into one YAML write, done off the event loop
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(SAVE_DELAY, self._write_config)
+    
+    async def _write_config(self) -> None:
+        """Write the config to disk and confirm in the UI."""
+        self._save_timer = None
+        try:
+            # Snapshot on the loop so the worker never iterates feeds the UI is editing
+            await asyncio.to_thread(self.config.save_config, self.config.config_snapshot())
             logger.info("Settings saved successfully")
             
             # Show confirmation
             self.feeds_container.mount(Label("✅ Settings saved!"))
-        
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
             self.feeds_container.mount(Label(f"❌ Error saving: {e}"))
     
-    def _add_new_feed(self) -> None:
+    def on_unmount(self) -> None:
+        """Flush a save that is still waiting on its timer."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+            self.config.save_config()
+    
+    async def _add_new_feed(self) -> None:
         """Add a new feed for this category."""
         try:
-            new_feed_name = f"custom_{len(self.feed_inputs) + 1}"
+            new_feed_name = f"custom_{len(self._feed_names) + 1}"
             new_feed_url = "https://example.com/feed.xml"
             
             # Add to config
-            if new_feed_name not in self.config.news.rss_feeds:
-                self.config.news.rss_feeds[new_feed_name] = {
-                    "url": new_feed_url,
-                    "categories": [self.current_category.value],
-                }
-                logger.info(f"Added new feed: {new_feed_name}")
+            if new_feed_name in self.config.news.rss_feeds:
+                logger.warning(f"Feed {new_feed_name} already exists")
+                return
+            self.config.news.rss_feeds[new_feed_name] = {
+                "url": new_feed_url,
+                "categories": [self.current_category.value],
+            }
+            logger.info(f"Added new feed: {new_feed_name}")
+            self.config.rebuild_feed_index()
             
-            # Refresh display
-            self._update_feeds_display()
+            # Mount just the new row; the rest of the list is unchanged
+            if not self._feed_names:
+                # Clear the "no feeds" placeholder
+                await self.feeds_container.remove_children()
+            self.feeds_container.mount_all(self._feed_row(new_feed_name, new_feed_url))
         
         except Exception as e:
             logger.error(f"Error adding feed: {e}")
@@ -1,12 +1,39 @@
 """Pytest configuration and shared fixtures."""
 
+import copy
 import pytest
+import pytest_asyncio
 import tempfile
 from pathlib import Path
+from src.api import NewsHandler
+from src.cache import CacheManager
 from src.config import ConfigManager
 from src.models import Category, Article
 from datetime import datetime
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Feed URLs answered from tests/fixtures instead of the network
+RECORDED_FEEDS = {
+    "https://news.ycombinator.com/rss": "hn.xml",
+    "https://www.reddit.com/r/technology/.rss": "reddit_technology.xml",
+}
+
+
+def pytest_addoption(parser):
+    """Add the --runslow switch for tests that hit real news feeds."""
+    parser.addoption("--runslow", action="store_true", default=False, help="run tests marked slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 
 @pytest.fixture
 def temp_config_dir():
@@ -15,13 +42,74 @@ def temp_config_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def config_manager(temp_config_dir):
-    """Create a ConfigManager instance for testing."""
-    config_file = temp_config_dir / "config.yaml"
+@pytest.fixture(scope="session")
+def _session_config_manager(tmp_path_factory):
+    """Build the default ConfigManager once for the whole session."""
+    config_file = tmp_path_factory.mktemp("config") / "config.yaml"
     return ConfigManager(config_path=config_file)
 
 
+@pytest.fixture
+def config_manager(request, _session_config_manager):
+    """Return the shared ConfigManager; tests marked ``mutates_config`` get a private copy."""
+    if request.node.get_closest_marker("mutates_config"):
+        return copy.deepcopy(_session_config_manager)
+    return _session_config_manager
+
+
+@pytest.fixture(scope="session")
+def cache_manager():
+    """Create one in-memory cache manager shared by the whole session."""
+    manager = CacheManager(db_path=":memory:")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture(scope="session")
+def _shared_cache_dir(tmp_path_factory):
+    """Create one directory for on-disk cache databases."""
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(scope="session")
+def file_cache_manager(_shared_cache_dir):
+    """Create one file-backed cache manager shared by the whole session."""
+    manager = CacheManager(db_path=str(_shared_cache_dir / "cache.db"))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(request):
+    """Empty the shared caches before each test that uses them."""
+    for name in ("cache_manager", "file_cache_manager"):
+        if name in request.fixturenames:
+            manager = request.getfixturevalue(name)
+            with manager._lock, manager._conn:
+                manager._conn.execute("DELETE FROM articles")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def handler():
+    """Create one NewsHandler for the whole session so its HTTP session is reused."""
+    news_handler = NewsHandler(http_cache_dir=None)
+    yield news_handler
+    await news_handler.close()
+
+
+@pytest.fixture
+def recorded_handler():
+    """Create a NewsHandler that serves recorded feed responses instead of fetching them."""
+    handler = NewsHandler(http_cache_dir=None)
+    
+    async def recorded_request(url, timeout, max_bytes=None):
+        name = RECORDED_FEEDS.get(url)
+        return (FIXTURES_DIR / name).read_text(encoding="utf-8") if name else None
+    
+    handler._request_text = recorded_request
+    return handler
+
+
 @pytest.fixture
 def sample_article():
     """Create a sample article for testing."""
@@ -38,10 +126,10 @@ def sample_article():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_articles():
-    """Create multiple sample articles for testing."""
-    return [
+    """Create multiple sample articles, shared per module; copy before changing one."""
+    return tuple(
         Article(
             id=f"test-{i}",
             headline=f"Test Article {i}",
@@ -51,4 +139,4 @@ def sample_articles():
             url=f"https://example.com/article-{i}",
         )
         for i in range(5)
-    ]
+    )
@@ -48,21 +48,31 @@ async def test_real_app_flow():
     
     # Test 3: Fetch news for each category
     print("\n[3/5] Testing News Fetching...")
-    handler = NewsHandler()
+    handler = NewsHandler(http_cache_dir=None)
     
+    # Collect sources first, then fetch every category concurrently over the shared session
+    jobs = []
     for category in [Category.BREAKING, Category.AGENTIC_AI_DEV, Category.AGENTIC_AI_BUS, Category.US, Category.TECH]:
+        feeds = cfg.get_feeds_for_category(category.value)
+        scraping = cfg.get_scraping_sources_for_category(category.value)
+        if not feeds and not scraping:
+            print(f"\n  Category: {category.value}")
+            print(f"    ⚠ No sources configured for {category.value}")
+            continue
+        jobs.append((category, feeds, scraping))
+    
+    results = await asyncio.gather(
+        *(handler.fetch_category(feeds, scraping, category, limit_per_source=3) for category, feeds, scraping in jobs),
+        return_exceptions=True,
+    )
+    
+    for (category, feeds, scraping), articles in zip(jobs, results):
         print(f"\n  Category: {category.value}")
+        print(f"    - Feeds: {len(feeds)}")
+        print(f"    - Scraping sources: {len(scraping)}")
         try:
-            feeds = cfg.get_feeds_for_category(category.value)
-            scraping = cfg.get_scraping_sources_for_category(category.value)
-            print(f"    - Feeds: {len(feeds)}")
-            print(f"    - Scraping sources: {len(scraping)}")
-            
-            if not feeds and not scraping:
-                print(f"    ⚠ No sources configured for {category.value}")
-                continue
-            
-            articles = await handler.fetch_category(feeds, scraping, category, limit_per_source=3)
+            if isinstance(articles, BaseException):
+                raise articles
             print(f"    ✓ Fetched {len(articles)} articles")
             
             if articles:
@@ -80,7 +90,9 @@ async def test_real_app_flow():
         except Exception as e:
             print(f"    ✗ Error: {e}")
             import traceback
-            traceback.print_exc()
+            traceback.print_exception(e)
+    
+    await handler.close()
     
     # Test 4: Settings View
     print("\n[4/5] Testing Settings View...")
@@ -1,7 +1,12 @@
 """Tests for API/news fetching functionality."""
 
+import asyncio
+from datetime import datetime, timedelta
+
 import pytest
-from src.api import NewsHandler
+from src.api import NewsHandler, _parse_article, _parse_scrape
+from src.api._http_cache import HttpCache
+from src.api._feed_parse import parse_feed
 from src.models import Category
 
 
@@ -11,7 +16,7 @@ class TestNewsHandler:
     @pytest.fixture
     def news_handler(self):
         """Create a NewsHandler instance."""
-        return NewsHandler()
+        return NewsHandler(http_cache_dir=None)
     
     def test_news_handler_initialization(self, news_handler):
         """Test NewsHandler initializes successfully."""
@@ -45,3 +50,236 @@ class TestNewsHandler:
         
         # Should not crash, should return empty or partial results
         assert isinstance(articles, list)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_of_same_url_are_coalesced(self, news_handler):
+        """Test identical in-flight requests share a single fetch."""
+        calls = []
+        
+        async def fake_request(url, timeout, max_bytes=None):
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return "<rss></rss>"
+        
+        news_handler._request_text = fake_request
+        url = "https://example.com/feed"
+        results = await asyncio.gather(*(news_handler._fetch_text(url) for _ in range(5)))
+        
+        assert results == ["<rss></rss>"] * 5
+        assert calls == [url]
+    
+    @pytest.mark.asyncio
+    async def test_cancelling_first_caller_does_not_empty_waiters(self, news_handler):
+        """Test a waiter still gets the body when the caller that started the fetch is cancelled."""
+        release = asyncio.Event()
+        
+        async def fake_request(url, timeout, max_bytes=None):
+            await release.wait()
+            return "<rss></rss>"
+        
+        news_handler._request_text = fake_request
+        url = "https://example.com/feed"
+        first = asyncio.ensure_future(news_handler._fetch_text(url))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(news_handler._fetch_text(url))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        
+        assert await second == "<rss></rss>"
+        assert first.cancelled()
+    
+    @pytest.mark.asyncio
+    async def test_stream_category_yields_fast_sources_first(self, news_handler):
+        """Test articles stream in completion order and are deduplicated."""
+        def feed(*ids):
+            items = "".join(f"<item><guid>{i}</guid><title>T{i}</title><link>http://x/{i}</link></item>" for i in ids)
+            return f"<rss><channel>{items}</channel></rss>"
+        
+        bodies = {"http://slow/feed": (0.05, feed("a", "b")), "http://fast/feed": (0.0, feed("b", "c"))}
+        
+        async def fake_request(url, timeout, max_bytes=None):
+            delay, body = bodies[url]
+            await asyncio.sleep(delay)
+            return body
+        
+        news_handler._request_text = fake_request
+        feeds = [{"name": "slow", "url": "http://slow/feed"}, {"name": "fast", "url": "http://fast/feed"}]
+        ids = [a.id async for a in news_handler.stream_category(feeds, [], Category.TECH)]
+        
+        assert ids == ["b", "c", "a"]
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_last_build_date_skips_parsing(self, news_handler, monkeypatch):
+        """Test a feed with the same lastBuildDate reuses the previous parse."""
+        import src.api as api
+        parsed = []
+        real = api._rss_articles
+        
+        def counting(*args, **kwargs):
+            parsed.append(args[0])
+            return real(*args, **kwargs)
+        
+        async def fake_request(url, timeout, max_bytes=None):
+            return (
+                "<rss><channel><lastBuildDate>Mon, 01 Jan 2024 00:00:00 GMT</lastBuildDate>"
+                "<item><guid>a</guid><title>A</title><link>http://x/a</link></item></channel></rss>"
+            )
+        
+        monkeypatch.setattr(api, "_rss_articles", counting)
+        news_handler._request_text = fake_request
+        first = await news_handler.fetch_from_rss("http://feed", "src", Category.TECH)
+        second = await news_handler.fetch_from_rss("http://feed", "src", Category.TECH)
+        
+        assert [a.id for a in first] == [a.id for a in second] == ["a"]
+        assert len(parsed) == 1
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_feed_reapplies_age_cutoff(self, news_handler, monkeypatch):
+        """Test articles reused from an unchanged feed still respect MAX_AGE_DAYS."""
+        import src.api as api
+        published = (datetime.utcnow() - timedelta(days=2)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+        
+        async def fake_request(url, timeout, max_bytes=None):
+            return (
+                "<rss><channel><lastBuildDate>Mon, 01 Jan 2024 00:00:00 GMT</lastBuildDate>"
+                f"<item><guid>a</guid><title>A</title><link>http://x/a</link><pubDate>{published}</pubDate></item>"
+                "</channel></rss>"
+            )
+        
+        news_handler._request_text = fake_request
+        first = await news_handler.fetch_from_rss("http://feed", "src", Category.TECH)
+        monkeypatch.setattr(api, "MAX_AGE_DAYS", 1)
+        second = await news_handler.fetch_from_rss("http://feed", "src", Category.TECH)
+        
+        assert [a.id for a in first] == ["a"]
+        assert second == []
+
+
+class TestHttpCache:
+    """Tests for the on-disk HTTP response cache."""
+    
+    def test_put_and_get_round_trip(self, tmp_path):
+        """Test cached bodies and validators are persisted per URL."""
+        cache = HttpCache(str(tmp_path), ttl=60)
+        url = "https://example.com/feed"
+        
+        assert cache.get(url) is None
+        cache.put(url, "<rss></rss>", etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        
+        entry = cache.get(url)
+        assert entry.body == "<rss></rss>"
+        assert entry.etag == '"abc"'
+        assert entry.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert cache.is_fresh(entry)
+    
+    def test_entries_expire_after_ttl(self, tmp_path):
+        """Test entries older than the TTL are not fresh."""
+        cache = HttpCache(str(tmp_path), ttl=0)
+        entry = cache.put("https://example.com/feed", "body")
+        assert not cache.is_fresh(entry)
+
+
+class TestParseFeed:
+    """Tests for the lxml-based RSS/Atom parser."""
+    
+    def test_parse_rss_items(self):
+        """Test RSS items are extracted with decoded text and UTC dates."""
+        rss = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>Example</title>
+    <item>
+      <title>Café opens</title>
+      <link>https://example.com/1</link>
+      <guid>item-1</guid>
+      <description>First summary</description>
+      <pubDate>Tue, 02 Jan 2024 10:00:00 +0200</pubDate>
+      <dc:creator>Jane</dc:creator>
+    </item>
+    <item>
+      <title>Second</title>
+      <link>https://example.com/2</link>
+    </item>
+  </channel>
+</rss>"""
+        entries = parse_feed(rss)
+        
+        assert len(entries) == 2
+        assert entries[0]["title"] == "Café opens"
+        assert entries[0]["link"] == "https://example.com/1"
+        assert entries[0]["id"] == "item-1"
+        assert entries[0]["summary"] == "First summary"
+        assert entries[0]["published"] == datetime(2024, 1, 2, 8, 0)
+        assert entries[0]["author"] == "Jane"
+        assert entries[1]["published"] is None
+        assert entries[1]["author"] is None
+    
+    def test_parse_atom_entries(self):
+        """Test Atom entries use href links and nested author names."""
+        atom = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Atom entry</title>
+    <link rel="alternate" href="https://example.com/a"/>
+    <id>tag:example.com,2024:1</id>
+    <published>2024-01-02T10:00:00Z</published>
+    <author><name>Al</name></author>
+    <summary>Atom summary</summary>
+  </entry>
+</feed>"""
+        entries = parse_feed(atom)
+        
+        assert entries == [{
+            "id": "tag:example.com,2024:1",
+            "title": "Atom entry",
+            "link": "https://example.com/a",
+            "summary": "Atom summary",
+            "published": datetime(2024, 1, 2, 10, 0),
+            "author": "Al",
+        }]
+    
+    def test_parse_respects_limit_and_bad_input(self):
+        """Test the limit stops parsing early and junk input yields nothing."""
+        items = "".join(f"<item><title>T{i}</title></item>" for i in range(10))
+        assert len(parse_feed(f"<rss><channel>{items}</channel></rss>", limit=3)) == 3
+        assert parse_feed("<html><body>not a feed") == []
+
+
+class TestParseArticle:
+    """Tests for article body extraction."""
+    
+    def test_prefers_article_element(self):
+        """Test the <article> element wins over class-based containers."""
+        html = '<p>nav</p><div class="entry-content">Entry</div><article>Main <b>body</b></article>'
+        assert _parse_article(html) == "Main\nbody"
+    
+    def test_matches_multi_class_containers(self):
+        """Test class selectors match elements carrying several classes."""
+        html = '<p>nav</p><section class="wide post-content">Post body</section>'
+        assert _parse_article(html) == "Post body"
+    
+    def test_falls_back_to_page_text(self):
+        """Test pages without known containers fall back to all text."""
+        assert _parse_article("<p>Only text</p>") == "Only text"
+
+
+class TestParseScrape:
+    """Tests for selector-based link scraping."""
+    
+    def test_extracts_links_and_resolves_relative_urls(self):
+        """Test matched elements yield (title, href) with absolute URLs."""
+        html = '<h2 class="t"><a href="/a"> First </a></h2><a class="t" href="http://b/x">Second</a><h2 class="t">none</h2>'
+        assert _parse_scrape(html, ".t", "http://site/", 10) == [
+            ("First", "http://site/a"),
+            ("Second", "http://b/x"),
+        ]
+    
+    def test_empty_page_returns_no_links(self):
+        """Test an empty document doesn't raise."""
+        assert _parse_scrape("", "h2 a", "http://site/", 10) == []
+    
+    def test_page_with_xml_declaration_is_scraped(self):
+        """Test XHTML pages that start with an encoding declaration still yield links."""
+        html = '<?xml version="1.0" encoding="utf-8"?>\n<html><body><h2><a href="/a">Café</a></h2></body></html>'
+        assert _parse_scrape(html, "h2 a", "http://site/", 10) == [("Café", "http://site/a")]
@@ -1,8 +1,8 @@
 """Tests for cache management."""
 
-import pytest
-import tempfile
-from pathlib import Path
+import logging
+import sqlite3
+from dataclasses import replace
 from datetime import datetime, timedelta
 from src.cache import CacheManager
 from src.models import Category
@@ -11,22 +11,19 @@ from src.models import Category
 class TestCacheManager:
     """Tests for CacheManager."""
     
-    @pytest.fixture
-    def cache_manager(self):
-        """Create a temporary cache manager for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            cache_path = tmp.name
-        
-        manager = CacheManager(db_path=cache_path)
-        yield manager
-        
-        # Cleanup
-        Path(cache_path).unlink(missing_ok=True)
-    
     def test_cache_manager_initialization(self, cache_manager):
         """Test cache manager initializes successfully."""
         assert cache_manager is not None
     
+    def test_connection_pragmas(self, tmp_path):
+        """Test the connection is tuned for a best-effort cache."""
+        manager = CacheManager(db_path=str(tmp_path / "cache.db"))
+        conn = manager._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -8000
+        manager.close()
+    
     def test_save_and_get_articles(self, cache_manager, sample_articles):
         """Test saving and retrieving articles from cache."""
         # Save articles
@@ -73,9 +70,9 @@ class TestCacheManager:
     
     def test_get_articles_by_category(self, cache_manager, sample_articles):
         """Test getting articles filtered by category."""
-        # Modify one article to have different category
-        sample_articles[0].category = Category.BUSINESS
-        cache_manager.save_articles(sample_articles)
+        # Copy one article with a different category
+        articles = [replace(sample_articles[0], category=Category.BUSINESS), *sample_articles[1:]]
+        cache_manager.save_articles(articles)
         
         # Get only TECH articles
         tech_articles = cache_manager.get_articles(
@@ -88,3 +85,96 @@ class TestCacheManager:
         assert len(tech_articles) == 4
         for article in tech_articles:
             assert article.category == Category.TECH
+    
+    def test_get_bookmarked_articles(self, cache_manager, sample_articles):
+        """Test only bookmarked articles are returned with their fields intact."""
+        cache_manager.save_articles(sample_articles)
+        cache_manager.mark_as_bookmarked("test-2")
+        
+        bookmarked = cache_manager.get_bookmarked_articles()
+        
+        assert [a.id for a in bookmarked] == ["test-2"]
+        assert bookmarked[0].is_bookmarked is True
+        assert bookmarked[0].headline == "Test Article 2"
+        assert bookmarked[0].category == Category.TECH
+    
+    def test_article_tags_round_trip(self, cache_manager, sample_article):
+        """Test tags survive a save/load cycle."""
+        cache_manager.save_articles([sample_article])
+        cached = cache_manager.get_articles(category=Category.TECH)
+        assert cached[0].tags == ["test", "sample"]
+    
+    def test_migrates_legacy_json_tags(self, tmp_path):
+        """Test databases with the old JSON tags column are migrated."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE articles (id TEXT PRIMARY KEY, headline TEXT, summary TEXT, source TEXT, "
+            "category TEXT, url TEXT, author TEXT, published_at TEXT, image_url TEXT, content TEXT, "
+            "read_time INTEGER, tags TEXT, is_read INTEGER DEFAULT 0, is_bookmarked INTEGER DEFAULT 0, "
+            "cached_at TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO articles (id, headline, category, tags, cached_at) VALUES (?, ?, ?, ?, ?)",
+            ("old-1", "Old", "tech", '["a", "b"]', datetime.utcnow().isoformat()),
+        )
+        conn.commit()
+        conn.close()
+        
+        manager = CacheManager(db_path=str(db_path))
+        cached = manager.get_articles(category=Category.TECH)
+        
+        assert cached[0].tags == ["a", "b"]
+        columns = {row[1] for row in manager._conn.execute("PRAGMA table_info(articles)")}
+        assert ("tags" in columns) == (sqlite3.sqlite_version_info < (3, 35))
+        manager.close()
+    
+    def test_migration_tolerates_malformed_json_tags(self, tmp_path):
+        """Test legacy rows with unparseable tags migrate as untagged."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE articles (id TEXT PRIMARY KEY, headline TEXT, summary TEXT, source TEXT, "
+            "category TEXT, url TEXT, author TEXT, published_at TEXT, image_url TEXT, content TEXT, "
+            "read_time INTEGER, tags TEXT, is_read INTEGER DEFAULT 0, is_bookmarked INTEGER DEFAULT 0, "
+            "cached_at TEXT)"
+        )
+        now = datetime.utcnow().isoformat()
+        conn.executemany(
+            "INSERT INTO articles (id, headline, category, tags, cached_at) VALUES (?, ?, ?, ?, ?)",
+            [("bad-1", "Bad", "tech", "[not json", now), ("good-1", "Good", "tech", '["a"]', now)],
+        )
+        conn.commit()
+        conn.close()
+        
+        manager = CacheManager(db_path=str(db_path))
+        tags = {a.id: a.tags for a in manager.get_articles(category=Category.TECH)}
+        
+        assert tags == {"bad-1": [], "good-1": ["a"]}
+        manager.close()
+    
+    def test_migration_runs_once_without_drop_column(self, tmp_path, monkeypatch, caplog):
+        """Test the emptied legacy column left by SQLite < 3.35 isn't migrated again."""
+        monkeypatch.setattr(sqlite3, "sqlite_version_info", (3, 34, 0))
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE articles (id TEXT PRIMARY KEY, headline TEXT, summary TEXT, source TEXT, "
+            "category TEXT, url TEXT, author TEXT, published_at TEXT, image_url TEXT, content TEXT, "
+            "read_time INTEGER, tags TEXT, is_read INTEGER DEFAULT 0, is_bookmarked INTEGER DEFAULT 0, "
+            "cached_at TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO articles (id, headline, category, tags, cached_at) VALUES (?, ?, ?, ?, ?)",
+            ("old-1", "Old", "tech", '["a"]', datetime.utcnow().isoformat()),
+        )
+        conn.commit()
+        conn.close()
+        CacheManager(db_path=str(db_path)).close()
+        
+        with caplog.at_level(logging.INFO, logger="src.cache"):
+            manager = CacheManager(db_path=str(db_path))
+        
+        assert "Migrating" not in caplog.text
+        assert manager.get_articles(category=Category.TECH)[0].tags == ["a"]
+        manager.close()
@@ -75,6 +75,14 @@ class TestConfigManager:
         assert isinstance(feeds, list)
         assert len(feeds) == 0
     
+    def test_feed_lookup_result_can_be_modified(self, config_manager):
+        """Test changing a returned feed list doesn't change later lookups."""
+        feeds = config_manager.get_feeds_for_category("tech")
+        count = len(feeds)
+        feeds.append({"name": "extra", "url": "https://example.com/feed"})
+        
+        assert len(config_manager.get_feeds_for_category("tech")) == count
+    
     def test_save_and_load_config(self, temp_config_dir):
         """Test saving and loading configuration."""
         config_file = temp_config_dir / "config.yaml"
@@ -96,3 +104,54 @@ class TestConfigManager:
         for source in sources:
             assert "name" in source
             assert "url" in source
+    
+    @pytest.mark.mutates_config
+    def test_feed_index_reflects_rebuild(self, config_manager):
+        """Test feeds added in place show up after rebuilding the index."""
+        config_manager.news.rss_feeds["custom_feed"] = {
+            "url": "https://example.com/feed.xml",
+            "categories": ["deals"],
+        }
+        assert config_manager.get_feeds_for_category("deals") == []
+        
+        config_manager.rebuild_feed_index()
+        
+        assert config_manager.get_feeds_for_category("deals") == [
+            {"name": "custom_feed", "url": "https://example.com/feed.xml"}
+        ]
+    
+    @pytest.mark.mutates_config
+    def test_feed_index_flags_non_http_urls(self, config_manager):
+        """Test the URL check is refreshed when the index is rebuilt."""
+        assert config_manager._all_urls_http
+        
+        config_manager.news.rss_feeds["local_feed"] = {"url": "file:///tmp/feed.xml", "categories": ["tech"]}
+        config_manager.rebuild_feed_index()
+        
+        assert not config_manager._all_urls_http
+    
+    @pytest.mark.mutates_config
+    def test_save_config_rebuilds_feed_index(self, config_manager, temp_config_dir):
+        """Test saving picks up feeds added in place."""
+        config_manager.config_path = temp_config_dir / "config.yaml"
+        config_manager.news.rss_feeds["custom_feed"] = {
+            "url": "https://example.com/feed.xml",
+            "categories": ["deals"],
+        }
+        
+        config_manager.save_config()
+        
+        assert config_manager.get_feeds_for_category("deals") == [
+            {"name": "custom_feed", "url": "https://example.com/feed.xml"}
+        ]
+    
+    def test_loaded_config_is_not_shared_between_instances(self, temp_config_dir):
+        """Test instances loaded from the same file don't share mutable state."""
+        config_file = temp_config_dir / "config.yaml"
+        ConfigManager(config_path=config_file).save_config()
+        
+        config1 = ConfigManager(config_path=config_file)
+        config2 = ConfigManager(config_path=config_file)
+        config1.news.rss_feeds["hackernews"]["url"] = "https://example.com/changed"
+        
+        assert config2.news.rss_feeds["hackernews"]["url"] == "https://news.ycombinator.com/rss"
@@ -1,56 +1,57 @@
 """Integration tests that test real app behavior."""
 
+import asyncio
 import pytest
 import tempfile
 from pathlib import Path
 from src.config import ConfigManager
 from src.cache import CacheManager
-from src.api import NewsHandler
 from src.models import Category, Article
 from datetime import datetime
 
+# Fixed publish time for canned articles keeps the flow tests deterministic
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 class TestCacheIntegration:
     """Test cache with real database operations."""
     
-    def test_cache_database_initialization(self):
+    def test_cache_database_initialization(self, file_cache_manager):
         """Test that cache database is properly created and initialized."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / ".newsapp" / "cache.db"
-            cache = CacheManager(db_path=str(db_path))
-            
-            # Database file should exist
-            assert db_path.exists()
-            
-            # Should be able to save articles
-            articles = [
-                Article(
-                    id="test-1",
-                    headline="Test Article",
-                    summary="Test summary",
-                    source="Test",
-                    category=Category.TECH,
-                    url="https://example.com"
-                )
-            ]
-            
-            # This should not raise any errors
-            cache.save_articles(articles)
-            
-            # Should be able to retrieve articles
-            retrieved = cache.get_articles(category=Category.TECH, max_age_hours=1)
-            assert len(retrieved) == 1
-            assert retrieved[0].id == "test-1"
+        cache = file_cache_manager
+        
+        # Database file should exist
+        assert Path(cache.db_path).exists()
+        
+        # Should be able to save articles
+        articles = [
+            Article(
+                id="test-1",
+                headline="Test Article",
+                summary="Test summary",
+                source="Test",
+                category=Category.TECH,
+                url="https://example.com"
+            )
+        ]
+        
+        # This should not raise any errors
+        cache.save_articles(articles)
+        
+        # Should be able to retrieve articles
+        retrieved = cache.get_articles(category=Category.TECH, max_age_hours=1)
+        assert len(retrieved) == 1
+        assert retrieved[0].id == "test-1"
     
-    def test_cache_handles_missing_directory(self):
+    def test_cache_handles_missing_directory(self, _shared_cache_dir):
         """Test cache creates missing parent directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Use a deeply nested path that doesn't exist
-            db_path = Path(tmpdir) / "deeply" / "nested" / "path" / "cache.db"
-            
-            # Should not raise an error
-            cache = CacheManager(db_path=str(db_path))
-            assert db_path.exists()
+        # Use a deeply nested path that doesn't exist
+        db_path = _shared_cache_dir / "deeply" / "nested" / "path" / "cache.db"
+        
+        # Should not raise an error
+        cache = CacheManager(db_path=str(db_path))
+        assert db_path.exists()
+        cache.close()
 
 
 class TestConfigIntegration:
@@ -67,9 +68,12 @@ class TestConfigIntegration:
             assert config.cache is not None
             assert config.news is not None
     
-    def test_config_returns_valid_feeds(self):
+    def test_config_returns_valid_feeds(self, config_manager):
         """Test that config returns actually usable feeds."""
-        config = ConfigManager()
+        config = config_manager
+        
+        # Every configured URL was checked once when the feed index was built
+        assert config._all_urls_http
         
         # Should have feeds for at least some categories
         for category in [Category.TECH, Category.US, Category.WORLD]:
@@ -82,7 +86,6 @@ class TestConfigIntegration:
             for feed in feeds:
                 assert 'name' in feed
                 assert 'url' in feed
-                assert feed['url'].startswith('http')
 
 
 @pytest.mark.integration
@@ -91,10 +94,8 @@ class TestNewsAPIIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_fetch_real_feed(self):
+    async def test_fetch_real_feed(self, handler):
         """Test fetching from a real RSS feed."""
-        handler = NewsHandler()
-        
         # Use a reliable test feed
         feeds = [{"name": "HN", "url": "https://news.ycombinator.com/rss"}]
         
@@ -125,10 +126,9 @@ class TestNewsAPIIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_fetch_multiple_feeds(self):
+    @pytest.mark.slow
+    async def test_fetch_multiple_feeds(self, handler):
         """Test fetching from multiple feeds successfully."""
-        handler = NewsHandler()
-        
         # Use multiple reliable feeds
         feeds = [
             {"name": "HN", "url": "https://news.ycombinator.com/rss"},
@@ -158,13 +158,52 @@ class TestNewsAPIIntegration:
         sources = {article.source for article in articles}
         assert len(sources) > 0, "Should have at least one unique source"
     
+    @pytest.mark.asyncio
+    async def test_fetch_recorded_feed(self, recorded_handler):
+        """Test parsing a recorded HN RSS response."""
+        articles = await recorded_handler.fetch_category(
+            feeds=[{"name": "HN", "url": "https://news.ycombinator.com/rss"}],
+            scraping=[],
+            category=Category.TECH,
+            limit_per_source=5
+        )
+        
+        assert len(articles) == 5
+        article = articles[0]
+        assert article.headline == "SQLite is not a toy database"
+        assert article.url == "https://antonz.org/sqlite-is-not-a-toy-database/"
+        assert article.category == Category.TECH
+        assert article.source == "HN"
+        assert len(article.summary) > 10
+    
+    @pytest.mark.asyncio
+    async def test_fetch_multiple_recorded_feeds(self, recorded_handler):
+        """Test recorded RSS and Atom responses are merged across sources."""
+        feeds = [
+            {"name": "HN", "url": "https://news.ycombinator.com/rss"},
+            {"name": "Reddit", "url": "https://www.reddit.com/r/technology/.rss"}
+        ]
+        
+        articles = await recorded_handler.fetch_category(
+            feeds=feeds,
+            scraping=[],
+            category=Category.TECH,
+            limit_per_source=3
+        )
+        
+        assert len(articles) == 6
+        assert {article.source for article in articles} == {"HN", "Reddit"}
+        for article in articles:
+            assert article.headline
+            assert article.url.startswith("https://")
+            assert article.summary or article.content
+    
     @pytest.mark.asyncio
     @pytest.mark.integration
     @pytest.mark.slow
-    async def test_all_configured_categories_fetch_news(self):
+    async def test_all_configured_categories_fetch_news(self, handler):
         """Test that all configured categories can successfully fetch news."""
         config = ConfigManager()
-        handler = NewsHandler()
         
         # Test ALL categories including new ones
         categories_to_test = [
@@ -179,6 +218,7 @@ class TestNewsAPIIntegration:
         ]
         
         failed_categories = []
+        fetches = []
         
         for category in categories_to_test:
             feeds = config.get_feeds_for_category(category.value)
@@ -188,32 +228,34 @@ class TestNewsAPIIntegration:
                 failed_categories.append((category.value, "No feeds configured"))
                 continue
             
-            try:
-                articles = await handler.fetch_category(
-                    feeds=feeds,
-                    scraping=[],
-                    category=category,
-                    limit_per_source=3
-                )
+            fetches.append((category, handler.fetch_category(
+                feeds=feeds,
+                scraping=[],
+                category=category,
+                limit_per_source=3
+            )))
+        
+        # Fetch all categories concurrently so the test waits on the slowest one, not the sum
+        results = await asyncio.gather(*(coro for _, coro in fetches), return_exceptions=True)
+        
+        for (category, _), articles in zip(fetches, results):
+            if isinstance(articles, Exception):
+                failed_categories.append((category.value, f"Error fetching: {str(articles)[:50]}"))
+            elif not articles:
+                failed_categories.append((category.value, "No articles fetched - feeds may be broken"))
+            else:
+                # Validate article content quality
+                article = articles[0]
                 
-                if not articles or len(articles) == 0:
-                    failed_categories.append((category.value, "No articles fetched - feeds may be broken"))
-                else:
-                    # Validate article content quality
-                    article = articles[0]
-                    
-                    # Check for required fields
-                    if not article.headline:
-                        failed_categories.append((category.value, "Articles missing headlines"))
-                    elif not article.url:
-                        failed_categories.append((category.value, "Articles missing URLs"))
-                    elif not article.source:
-                        failed_categories.append((category.value, "Articles missing source"))
-                    elif not (article.summary or article.content):
-                        failed_categories.append((category.value, "Articles missing content/summary"))
-                    
-            except Exception as e:
-                failed_categories.append((category.value, f"Error fetching: {str(e)[:50]}"))
+                # Check for required fields
+                if not article.headline:
+                    failed_categories.append((category.value, "Articles missing headlines"))
+                elif not article.url:
+                    failed_categories.append((category.value, "Articles missing URLs"))
+                elif not article.source:
+                    failed_categories.append((category.value, "Articles missing source"))
+                elif not (article.summary or article.content):
+                    failed_categories.append((category.value, "Articles missing content/summary"))
         
         # Report all failures
         if failed_categories:
@@ -225,10 +267,8 @@ class TestNewsAPIIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_category_with_no_feeds_returns_empty(self):
+    async def test_category_with_no_feeds_returns_empty(self, handler):
         """Test that categories with no configured feeds return empty list."""
-        handler = NewsHandler()
-        
         articles = await handler.fetch_category(
             feeds=[],
             scraping=[],
@@ -240,96 +280,80 @@ class TestNewsAPIIntegration:
         assert len(articles) == 0, "Should return empty list when no feeds configured"
 
 
+async def fake_fetch(handler):
+    """Return one canned article without touching the network."""
+    return [
+        Article(
+            id="flow-test-1",
+            headline="Flow Test Article",
+            summary="Testing the complete flow",
+            source="Test Source",
+            category=Category.TECH,
+            url="https://example.com/article",
+            published_at=_FIXED_NOW
+        )
+    ]
+
+
+async def real_fetch(handler):
+    """Fetch live articles from HN."""
+    feeds = [{"name": "HN", "url": "https://news.ycombinator.com/rss"}]
+    return await handler.fetch_category(
+        feeds=feeds,
+        scraping=[],
+        category=Category.TECH,
+        limit_per_source=5
+    )
+
+
 class TestEndToEndFlow:
     """Test complete workflow from fetch to cache to retrieve."""
     
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_fetch_and_cache_flow(self):
+    @pytest.mark.parametrize(
+        "fetch_fn",
+        [fake_fetch, pytest.param(real_fetch, marks=pytest.mark.slow)],
+        ids=["fake", "real"],
+    )
+    async def test_fetch_cache_retrieve_flow(self, fetch_fn, handler, cache_manager):
         """Test the full flow: fetch news -> save to cache -> retrieve."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Set up components
-            db_path = Path(tmpdir) / "cache.db"
-            cache = CacheManager(db_path=str(db_path))
-            handler = NewsHandler()
-            
-            # Create test article
-            test_article = Article(
-                id="flow-test-1",
-                headline="Flow Test Article",
-                summary="Testing the complete flow",
-                source="Test Source",
-                category=Category.BUSINESS,
-                url="https://example.com/article",
-                published_at=datetime.now()
-            )
-            
-            # Save to cache
-            cache.save_articles([test_article])
-            
-            # Retrieve from cache
-            cached_articles = cache.get_articles(
-                category=Category.BUSINESS,
-                max_age_hours=1,
-                limit=10
-            )
-            
-            # Verify
-            assert len(cached_articles) == 1
-            assert cached_articles[0].id == "flow-test-1"
-            assert cached_articles[0].headline == "Flow Test Article"
-            assert cached_articles[0].category == Category.BUSINESS
-    
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    @pytest.mark.slow
-    async def test_real_fetch_cache_retrieve_flow(self):
-        """Test the full flow with actual news fetching."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Set up components
-            db_path = Path(tmpdir) / "cache.db"
-            cache = CacheManager(db_path=str(db_path))
-            handler = NewsHandler()
-            
-            # Fetch real articles
-            feeds = [{"name": "HN", "url": "https://news.ycombinator.com/rss"}]
-            articles = await handler.fetch_category(
-                feeds=feeds,
-                scraping=[],
-                category=Category.TECH,
-                limit_per_source=5
-            )
-            
-            # Should have fetched articles
-            assert len(articles) > 0, "Should fetch real articles from HN"
-            
-            # Validate fetched articles have content
-            for article in articles:
-                assert article.headline, "Fetched article should have headline"
-                assert article.url, "Fetched article should have URL"
-                assert article.summary or article.content, "Fetched article should have content"
-            
-            # Save to cache
-            cache.save_articles(articles)
-            
-            # Retrieve from cache
-            cached_articles = cache.get_articles(
-                category=Category.TECH,
-                max_age_hours=1,
-                limit=10
-            )
-            
-            # Verify cached articles match fetched articles
-            assert len(cached_articles) > 0, "Should have cached articles"
-            assert len(cached_articles) <= len(articles), "Cached count should not exceed fetched count"
-            
-            # Verify cached articles retained content
-            for article in cached_articles:
-                assert article.headline, "Cached article should have headline"
-                assert article.url, "Cached article should have URL"
-                assert article.summary or article.content, "Cached article should have content"
-            
-            # Verify article integrity
-            cached_ids = {a.id for a in cached_articles}
-            original_ids = {a.id for a in articles}
-            assert cached_ids.issubset(original_ids), "Cached articles should match original articles"
+        # Set up components (persistence is covered by TestCacheIntegration, so stay in memory)
+        cache = cache_manager
+        
+        # Fetch articles
+        articles = await fetch_fn(handler)
+        
+        # Should have fetched articles
+        assert len(articles) > 0, "Should fetch articles"
+        
+        # Validate fetched articles have content
+        for article in articles:
+            assert article.headline, "Fetched article should have headline"
+            assert article.url, "Fetched article should have URL"
+            assert article.summary or article.content, "Fetched article should have content"
+        
+        # Save to cache
+        cache.save_articles(articles)
+        
+        # Retrieve from cache
+        cached_articles = cache.get_articles(
+            category=Category.TECH,
+            max_age_hours=1,
+            limit=10
+        )
+        
+        # Verify cached articles match fetched articles
+        assert len(cached_articles) > 0, "Should have cached articles"
+        assert len(cached_articles) <= len(articles), "Cached count should not exceed fetched count"
+        
+        # Verify cached articles retained content
+        for article in cached_articles:
+            assert article.headline, "Cached article should have headline"
+            assert article.url, "Cached article should have URL"
+            assert article.summary or article.content, "Cached article should have content"
+        
+        # Verify article integrity
+        cached_ids = {a.id for a in cached_articles}
+        original_ids = {a.id for a in articles}
+        assert cached_ids.issubset(original_ids), "Cached articles should match original articles"
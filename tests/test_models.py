@@ -1,6 +1,7 @@
 """Tests for data models."""
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 from src.models import Article, Category, AppState, FeedConfig
 
@@ -41,11 +42,32 @@ class TestArticle:
         article_set = {sample_article}
         assert sample_article in article_set
     
+    def test_article_uses_slots(self, sample_article):
+        """Test articles are slotted (no per-instance __dict__)."""
+        assert not hasattr(sample_article, "__dict__")
+    
     def test_article_tags(self, sample_article):
         """Test article tags."""
         assert "test" in sample_article.tags
         assert "sample" in sample_article.tags
         assert len(sample_article.tags) == 2
+    
+    def test_article_display_text_prefers_content(self, sample_article):
+        """Test display text is resolved from content, then summary."""
+        assert sample_article.display_text == (sample_article.content or sample_article.summary)
+        article = Article(
+            id="x", headline="h", summary="short", source="s",
+            category=Category.US, url="u", content="full body",
+        )
+        assert article.display_text == "full body"
+    
+    def test_article_display_text_tracks_replaced_content(self, sample_article):
+        """Test display text is re-derived on replace and ignored by equality and repr."""
+        updated = replace(sample_article, content="new body")
+        
+        assert updated.display_text == "new body"
+        assert "display_text" not in repr(updated)
+        assert replace(sample_article) == sample_article
 
 
 class TestFeedConfig:
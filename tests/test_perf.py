@@ -0,0 +1,28 @@
+"""Micro-benchmarks for hot lookup paths (requires pytest-benchmark)."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.models import Category
+
+
+@pytest.mark.benchmark(group="config")
+class TestConfigLookupPerf:
+    """Benchmarks for ConfigManager category lookups."""
+    
+    def test_feeds_lookup(self, benchmark, config_manager):
+        """Benchmark looking up feeds for every category."""
+        categories = [c.value for c in Category]
+        
+        result = benchmark(lambda: [config_manager.get_feeds_for_category(c) for c in categories])
+        
+        assert len(result) == len(categories)
+    
+    def test_scraping_sources_lookup(self, benchmark, config_manager):
+        """Benchmark looking up scraping sources for every category."""
+        categories = [c.value for c in Category]
+        
+        result = benchmark(lambda: [config_manager.get_scraping_sources_for_category(c) for c in categories])
+        
+        assert len(result) == len(categories)
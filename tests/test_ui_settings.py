@@ -1,7 +1,11 @@
 """Tests for UI settings view."""
 
+import asyncio
+
 import pytest
-from src.ui.settings import SettingsView
+from textual.app import App
+
+from src.ui.settings import SAVE_DELAY, SettingsView
 from src.models import Category
 
 
@@ -25,3 +29,24 @@ class TestSettingsView:
         settings = SettingsView(config_manager)
         assert isinstance(settings.feed_inputs, dict)
         assert len(settings.feed_inputs) == 0  # Empty until mounted
+    
+    @pytest.mark.asyncio
+    @pytest.mark.mutates_config
+    async def test_rapid_saves_write_config_once(self, config_manager, monkeypatch):
+        """Test clicking Save twice in quick succession writes the config once."""
+        saves = []
+        monkeypatch.setattr(config_manager, "save_config", lambda data=None: saves.append(data))
+        
+        class SettingsApp(App):
+            def compose(self):
+                yield SettingsView(config_manager)
+        
+        async with SettingsApp().run_test(size=(120, 60)) as pilot:
+            await pilot.click("#save-btn")
+            await pilot.click("#save-btn")
+            await asyncio.sleep(SAVE_DELAY * 3)
+            await pilot.pause()
+        
+        assert len(saves) == 1
+        assert saves[0]["news"]["rss_feeds"] == config_manager.news.rss_feeds
+        assert saves[0]["news"]["rss_feeds"] is not config_manager.news.rss_feeds
@@ -5,103 +5,208 @@ This script uses only standard library and doesn't require dependencies.
 """
 
 import ast
+import os
+import re
 import sys
-from pathlib import Path
 
+# Resolved once at import rather than rebuilt on every call
+_MAIN_PY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "main.py")
 
-def verify_fix():
-    """Verify that the fix for the back button is present in main.py."""
+# Identifiers the checks compare against. The parser interns identifiers, so == on the
+# parsed tree hits the identity fast path
+UI_CLASS = sys.intern("NewsAppUI")
+OLD_HANDLER = sys.intern("on_message")
+MESSAGE_CLASS = sys.intern("BackToDashboardMessage")
+SHOW_DASHBOARD = sys.intern("_show_dashboard")
+
+# Message handlers NewsAppUI must define, mapped to the method each one must call
+HANDLERS = {sys.intern("on_back_to_dashboard_message"): SHOW_DASHBOARD}
+
+# Report text, built once so each outcome is a single write
+MSG_OLD_HANDLER = (
+    "⚠️  Warning: Old 'on_message' handler with BackToDashboardMessage handling still exists\n"
+    "   This could cause conflicts. Consider removing the old handler.\n"
+)
+MSG_SUCCESS = (
+    "✅ Back button fix verified successfully!\n"
+    "\n"
+    "Details:\n"
+    "  ✓ Handler method 'on_back_to_dashboard_message' exists\n"
+    "  ✓ Method has correct signature: (self, message: BackToDashboardMessage)\n"
+    "  ✓ Method calls _show_dashboard()\n"
+    "\n"
+    "The fix follows Textual's message handling pattern:\n"
+    "  - Messages are handled by methods named 'on_<message_name>'\n"
+    "  - BackToDashboardMessage → on_back_to_dashboard_message\n"
+    "\n"
+    "Next steps:\n"
+    "  1. Test manually in Docker: docker compose up --build\n"
+    "  2. Press 'S' to open Settings\n"
+    "  3. Click '← Back' button\n"
+    "  4. Verify you return to the dashboard\n"
+)
+
+# Lexical checks that can rule main.py out without parsing it; a match still goes to the AST
+CLASS_RE = re.compile(rb"\bclass\s+NewsAppUI\b")
+HANDLER_RE = re.compile(rb"\bdef\s+on_back_to_dashboard_message\b")
+
+# Source of a top-level NewsAppUI class: up to the next line starting with code at column 0
+CLASS_SLICE_RE = re.compile(rb"^class\s+NewsAppUI\b.*?(?=^[^\s#]|\Z)", re.M | re.S)
+
+
+# Leaf nodes that can never contain a Call or Name, so the walk doesn't descend into them
+_LEAF_TYPES = frozenset(
+    cls
+    for base in (ast.expr_context, ast.boolop, ast.operator, ast.unaryop, ast.cmpop)
+    for cls in base.__subclasses__()
+) | {ast.Constant}
+
+
+def scan_func(fn, call_attr=SHOW_DASHBOARD):
+    """Return (calls call_attr, mentions BackToDashboardMessage) for fn in a single walk."""
+    # Locals are cheaper than global/builtin lookups in the per-node loop
+    _type = type
+    _Call = ast.Call
+    _Attribute = ast.Attribute
+    _Name = ast.Name
+    leaves = _LEAF_TYPES
+    message_class = MESSAGE_CLASS
+    children = ast.iter_child_nodes
+    calls_target = False
+    mentions_message = False
+    stack = [fn]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node = pop()
+        t = _type(node)
+        if t is _Call:
+            if _type(node.func) is _Attribute and node.func.attr == call_attr:
+                calls_target = True
+        elif t is _Name:
+            if node.id == message_class:
+                mentions_message = True
+        if calls_target and mentions_message:
+            break
+        for child in children(node):
+            if _type(child) not in leaves:
+                push(child)
+    return calls_target, mentions_message
+
+
+def load_tree(path, content):
+    """Parse the NewsAppUI part of the source bytes read from path."""
+    # Only NewsAppUI is inspected, so parse just its slice of the file when it can be cut out.
+    # A slice that stops mid-string or mid-expression fails to compile and the whole file is
+    # parsed instead. compile(PyCF_ONLY_AST) is ast.parse without the wrapper.
+    tree = None
+    m = CLASS_SLICE_RE.search(content)
+    if m:
+        try:
+            tree = compile(m.group(0), path, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+        except SyntaxError:
+            tree = None
+    if tree is None:
+        tree = compile(content, path, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+    return tree
+
+
+def _check_source(path, content):
+    """Check main.py's source bytes; returns (error message or None, old on_message handler found)."""
+    if not CLASS_RE.search(content):
+        return "❌ Could not find NewsAppUI class", False
     
-    # Read the main.py file
-    main_py_path = Path(__file__).parent / "src" / "main.py"
+    if not HANDLER_RE.search(content):
+        return "❌ New message handler 'on_back_to_dashboard_message' not found", False
     
-    if not main_py_path.exists():
-        print(f"❌ Could not find {main_py_path}")
-        return False
+    # An old on_message handler can only reference the message class if the source does
+    may_have_old_handler = b"BackToDashboardMessage" in content
     
-    with open(main_py_path, 'r') as f:
-        content = f.read()
-        tree = ast.parse(content)
+    tree = load_tree(path, content)
     
-    # Find the NewsAppUI class
-    news_app_ui_class = None
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef) and node.name == "NewsAppUI":
-            news_app_ui_class = node
-            break
+    # Concrete node classes have no subclasses, so exact type checks are safe and cheaper
+    _type = type
+    _ClassDef = ast.ClassDef
+    _FunctionDef = ast.FunctionDef
+    _If = ast.If
+    
+    # Find the NewsAppUI class; it lives at module level, at most one `if` block deep
+    top_level = []
+    for node in tree.body:
+        if _type(node) is _If:
+            top_level += node.body
+            top_level += node.orelse
+        else:
+            top_level.append(node)
+    news_app_ui_class = next(
+        (n for n in top_level if _type(n) is _ClassDef and n.name == UI_CLASS), None
+    )
     
     if not news_app_ui_class:
-        print("❌ Could not find NewsAppUI class")
-        return False
+        return "❌ Could not find NewsAppUI class", False
     
-    # Check for the correct message handler method
-    handler_found = False
+    # Check for the correct message handler methods
+    found_handlers = set()
     old_handler_found = False
     
     for item in news_app_ui_class.body:
-        if isinstance(item, ast.FunctionDef):
-            if item.name == "on_back_to_dashboard_message":
-                handler_found = True
-                
-                # Verify the method signature
-                args = item.args.args
-                if len(args) < 2:
-                    print("❌ Handler method has incorrect number of parameters")
-                    return False
-                
-                # Check parameter names
-                if args[0].arg != 'self' or args[1].arg != 'message':
-                    print("❌ Handler method has incorrect parameter names")
-                    return False
-                
-                # Check that it calls _show_dashboard
-                calls_show_dashboard = False
-                for node in ast.walk(item):
-                    if isinstance(node, ast.Call):
-                        if isinstance(node.func, ast.Attribute):
-                            if node.func.attr == "_show_dashboard":
-                                calls_show_dashboard = True
-                
-                if not calls_show_dashboard:
-                    print("❌ Handler method doesn't call _show_dashboard()")
-                    return False
+        if _type(item) is not _FunctionDef:
+            continue
+        name = item.name
+        expected_call = HANDLERS.get(name)
+        if expected_call is not None:
+            found_handlers.add(name)
+            
+            # Verify the method signature
+            args = item.args.args
+            if len(args) < 2:
+                return "❌ Handler method has incorrect number of parameters", False
             
-            elif item.name == "on_message":
-                # Check if the old problematic handler still exists and handles BackToDashboardMessage
-                has_dashboard_check = False
-                for node in ast.walk(item):
-                    if isinstance(node, ast.Name) and node.id == "BackToDashboardMessage":
-                        has_dashboard_check = True
-                        break
-                
-                if has_dashboard_check:
-                    old_handler_found = True
+            # Check parameter names
+            if args[0].arg != 'self' or args[1].arg != 'message':
+                return "❌ Handler method has incorrect parameter names", False
+            
+            # Check that it calls the expected method
+            calls_expected, _ = scan_func(item, expected_call)
+            
+            if not calls_expected:
+                return f"❌ Handler method doesn't call {expected_call}()", False
+        
+        elif may_have_old_handler and name == OLD_HANDLER:
+            # Check if the old problematic handler still exists and handles BackToDashboardMessage
+            _, has_dashboard_check = scan_func(item)
+            
+            if has_dashboard_check:
+                old_handler_found = True
+    
+    for name in HANDLERS:
+        if name not in found_handlers:
+            return f"❌ New message handler '{name}' not found", False
+    
+    return None, old_handler_found
+
+
+def verify_fix():
+    """Verify that the fix for the back button is present in main.py."""
+    
+    # Raw bytes: the parser handles the encoding itself, so skip decoding to str
+    try:
+        with open(_MAIN_PY, 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        sys.stdout.write(f"❌ Could not find {_MAIN_PY}\n")
+        return False
     
-    if not handler_found:
-        print("❌ New message handler 'on_back_to_dashboard_message' not found")
+    error, old_handler_found = _check_source(_MAIN_PY, content)
+    if error:
+        sys.stdout.write(error + "\n")
         return False
     
     if old_handler_found:
-        print("⚠️  Warning: Old 'on_message' handler with BackToDashboardMessage handling still exists")
-        print("   This could cause conflicts. Consider removing the old handler.")
+        sys.stdout.write(MSG_OLD_HANDLER)
     
     # All checks passed
-    print("✅ Back button fix verified successfully!")
-    print()
-    print("Details:")
-    print("  ✓ Handler method 'on_back_to_dashboard_message' exists")
-    print("  ✓ Method has correct signature: (self, message: BackToDashboardMessage)")
-    print("  ✓ Method calls _show_dashboard()")
-    print()
-    print("The fix follows Textual's message handling pattern:")
-    print("  - Messages are handled by methods named 'on_<message_name>'")
-    print("  - BackToDashboardMessage → on_back_to_dashboard_message")
-    print()
-    print("Next steps:")
-    print("  1. Test manually in Docker: docker compose up --build")
-    print("  2. Press 'S' to open Settings")
-    print("  3. Click '← Back' button")
-    print("  4. Verify you return to the dashboard")
+    sys.stdout.write(MSG_SUCCESS)
     
     return True
 